@@ -28,7 +28,9 @@ class SerializerToolbox(object):
     def filter_fields(data, fields):  # type: (Dict[str, Any], Optional[List[str]]) -> Dict[str, Any]
         if fields is None:
             return data
-        return {field: data[field] for field in fields}
+        # The requested fields are validated upfront, against the serializer's FIELDS. Fields
+        # without data (e.g. a thermostat without schedule) are left out.
+        return {field: data[field] for field in fields if field in data}
 
     @staticmethod
     def deserialize(dto, api_data, mapping):
@@ -27,6 +27,9 @@ if False:  # MYPY
 class GroupActionSerializer(object):
     WORD_MAX = 2 ** 16 - 1
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'name': ('name', None),
+                           'actions': ('actions', lambda s: [] if s == '' else [int(a) for a in s.split(',')])}
+    FIELDS = frozenset(['id', 'name', 'actions'])
 
     @staticmethod
     def serialize(group_action_dto, fields):  # type: (GroupActionDTO, Optional[List[str]]) -> Dict
@@ -42,7 +45,6 @@ class GroupActionSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=group_action_dto,  # Referenced
             api_data=api_data,
-            mapping={'name': ('name', None),
-                     'actions': ('actions', lambda s: [] if s == '' else [int(a) for a in s.split(',')])}
+            mapping=GroupActionSerializer.DESERIALIZE_MAPPING
         )
         return group_action_dto, loaded_fields
@@ -27,6 +27,15 @@ if False:  # MYPY
 
 class InputSerializer(object):
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'module_type': ('module_type', None),
+                           'name': ('name', None),
+                           'action': ('action', BYTE_MAX),
+                           'basic_actions': ('basic_actions', lambda s: [] if s == '' else [int(a) for a in s.split(',')]),
+                           'invert': ('invert', lambda i: i != 255),
+                           'can': ('can', lambda s: s == 'C'),
+                           'event_enabled': ('event_enabled', None),
+                           'room': ('room', BYTE_MAX)}
+    FIELDS = frozenset(['id', 'module_type', 'name', 'action', 'basic_actions', 'invert', 'room', 'can', 'event_enabled'])
 
     @staticmethod
     def serialize(input_dto, fields):  # type: (InputDTO, Optional[List[str]]) -> Dict
@@ -48,13 +57,6 @@ class InputSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=input_dto,  # Referenced
             api_data=api_data,
-            mapping={'module_type': ('module_type', None),
-                     'name': ('name', None),
-                     'action': ('action', InputSerializer.BYTE_MAX),
-                     'basic_actions': ('basic_actions', lambda s: [] if s == '' else [int(a) for a in s.split(',')]),
-                     'invert': ('invert', lambda i: i != 255),
-                     'can': ('can', lambda s: s == 'C'),
-                     'event_enabled': ('event_enabled', None),
-                     'room': ('room', InputSerializer.BYTE_MAX)}
+            mapping=InputSerializer.DESERIALIZE_MAPPING
         )
         return input_dto, loaded_fields
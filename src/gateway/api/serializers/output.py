@@ -28,6 +28,15 @@ if False:  # MYPY
 class OutputSerializer(object):
     WORD_MAX = 2 ** 16 - 1
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'module_type': ('module_type', None),
+                           'name': ('name', None),
+                           'type': ('output_type', None),
+                           'timer': ('timer', WORD_MAX),
+                           'floor': ('floor', BYTE_MAX),
+                           'room': ('room', BYTE_MAX)}
+    FIELDS = frozenset(['id', 'module_type', 'name', 'timer', 'floor', 'type', 'can_led_1_id',
+                        'can_led_1_function', 'can_led_2_id', 'can_led_2_function', 'can_led_3_id',
+                        'can_led_3_function', 'can_led_4_id', 'can_led_4_function', 'room'])
 
     @staticmethod
     def serialize(output_dto, fields):  # type: (OutputDTO, Optional[List[str]]) -> Dict
@@ -55,12 +64,7 @@ class OutputSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=output_dto,  # Referenced
             api_data=api_data,
-            mapping={'module_type': ('module_type', None),
-                     'name': ('name', None),
-                     'type': ('output_type', None),
-                     'timer': ('timer', OutputSerializer.WORD_MAX),
-                     'floor': ('floor', OutputSerializer.BYTE_MAX),
-                     'room': ('room', OutputSerializer.BYTE_MAX)}
+            mapping=OutputSerializer.DESERIALIZE_MAPPING
         )
         for i in range(4):
             base_field = 'can_led_{0}'.format(i + 1)
@@ -27,6 +27,11 @@ if False:  # MYPY
 
 class PulseCounterSerializer(object):
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'name': ('name', None),
+                           'persistent': ('persistent', None),
+                           'input': ('input_id', BYTE_MAX),
+                           'room': ('room', BYTE_MAX)}
+    FIELDS = frozenset(['id', 'name', 'input', 'persistent', 'room'])
 
     @staticmethod
     def serialize(pulse_counter_dto, fields):  # type: (PulseCounterDTO, Optional[List[str]]) -> Dict
@@ -44,9 +49,6 @@ class PulseCounterSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=pulse_counter_dto,  # Referenced
             api_data=api_data,
-            mapping={'name': ('name', None),
-                     'persistent': ('persistent', None),
-                     'input': ('input_id', PulseCounterSerializer.BYTE_MAX),
-                     'room': ('room', PulseCounterSerializer.BYTE_MAX)}
+            mapping=PulseCounterSerializer.DESERIALIZE_MAPPING
         )
         return pulse_counter_dto, loaded_fields
@@ -26,6 +26,7 @@ if False:  # MYPY
 
 
 class RoomSerializer(object):
+    FIELDS = frozenset(['id', 'name', 'floor'])
 
     @staticmethod
     def serialize(room_dto, fields):  # type: (RoomDTO, Optional[List[str]]) -> Dict
@@ -27,6 +27,10 @@ if False:  # MYPY
 
 class SensorSerializer(object):
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'name': ('name', None),
+                           'offset': ('offset', None),
+                           'virtual': ('virtual', None)}
+    FIELDS = frozenset(['id', 'name', 'offset', 'virtual'])
 
     @staticmethod
     def serialize(sensor_dto, fields):  # type: (SensorDTO, Optional[List[str]]) -> Dict
@@ -43,8 +47,6 @@ class SensorSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=sensor_dto,  # Referenced
             api_data=api_data,
-            mapping={'name': ('name', None),
-                     'offset': ('offset', None),
-                     'virtual': ('virtual', None)}
+            mapping=SensorSerializer.DESERIALIZE_MAPPING
         )
         return sensor_dto, loaded_fields
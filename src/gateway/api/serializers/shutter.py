@@ -28,6 +28,15 @@ if False:  # MYPY
 class ShutterSerializer(object):
     WORD_MAX = 2 ** 16 - 1
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'name': ('name', None),
+                           'timer_up': ('timer_up', BYTE_MAX),
+                           'timer_down': ('timer_down', BYTE_MAX),
+                           'up_down_config': ('up_down_config', BYTE_MAX),
+                           'group_1': ('group_1', BYTE_MAX),
+                           'group_2': ('group_2', BYTE_MAX),
+                           'room': ('room', BYTE_MAX),
+                           'steps': ('steps', WORD_MAX)}
+    FIELDS = frozenset(['id', 'name', 'timer_up', 'timer_down', 'up_down_config', 'group_1', 'group_2', 'room', 'steps'])
 
     @staticmethod
     def serialize(shutter_dto, fields):  # type: (ShutterDTO, Optional[List[str]]) -> Dict
@@ -49,13 +58,6 @@ class ShutterSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=shutter_dto,  # Referenced
             api_data=api_data,
-            mapping={'name': ('name', None),
-                     'timer_up': ('timer_up', ShutterSerializer.BYTE_MAX),
-                     'timer_down': ('timer_down', ShutterSerializer.BYTE_MAX),
-                     'up_down_config': ('up_down_config', ShutterSerializer.BYTE_MAX),
-                     'group_1': ('group_1', ShutterSerializer.BYTE_MAX),
-                     'group_2': ('group_2', ShutterSerializer.BYTE_MAX),
-                     'room': ('room', ShutterSerializer.BYTE_MAX),
-                     'steps': ('steps', ShutterSerializer.WORD_MAX)}
+            mapping=ShutterSerializer.DESERIALIZE_MAPPING
         )
         return shutter_dto, loaded_fields
@@ -27,6 +27,10 @@ if False:  # MYPY
 
 class ShutterGroupSerializer(object):
     BYTE_MAX = 255
+    DESERIALIZE_MAPPING = {'timer_up': ('timer_up', BYTE_MAX),
+                           'timer_down': ('timer_down', BYTE_MAX),
+                           'room': ('room', BYTE_MAX)}
+    FIELDS = frozenset(['id', 'timer_up', 'timer_down', 'room'])
 
     @staticmethod
     def serialize(shutter_group_dto, fields):  # type: (ShutterGroupDTO, Optional[List[str]]) -> Dict
@@ -43,8 +47,6 @@ class ShutterGroupSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=shutter_group_dto,  # Referenced
             api_data=api_data,
-            mapping={'timer_up': ('timer_up', ShutterGroupSerializer.BYTE_MAX),
-                     'timer_down': ('timer_down', ShutterGroupSerializer.BYTE_MAX),
-                     'room': ('room', ShutterGroupSerializer.BYTE_MAX)}
+            mapping=ShutterGroupSerializer.DESERIALIZE_MAPPING
         )
         return shutter_group_dto, loaded_fields
@@ -26,6 +26,25 @@ if False:  # MYPY
 
 class ThermostatSerializer(object):
     BYTE_MAX = 255
+    SCHEDULE_FIELDS = ('auto_mon', 'auto_tue', 'auto_wed', 'auto_thu', 'auto_fri', 'auto_sat', 'auto_sun')
+    DESERIALIZE_MAPPING = {'name': ('name', None),
+                           'permanent_manual': ('permanent_manual', None),
+                           'setp0': ('setp0', None),
+                           'setp1': ('setp1', None),
+                           'setp2': ('setp2', None),
+                           'setp3': ('setp3', None),
+                           'setp4': ('setp4', None),
+                           'setp5': ('setp5', None),
+                           'room': ('room', BYTE_MAX),
+                           'sensor': ('sensor', BYTE_MAX),
+                           'output0': ('output0', BYTE_MAX),
+                           'output1': ('output1', BYTE_MAX),
+                           'pid_p': ('pid_p', BYTE_MAX),
+                           'pid_i': ('pid_i', BYTE_MAX),
+                           'pid_d': ('pid_d', BYTE_MAX),
+                           'pid_int': ('pid_int', BYTE_MAX)}
+    FIELDS = frozenset(['id', 'name', 'room', 'setp0', 'setp1', 'setp2', 'setp3', 'setp4', 'setp5', 'sensor',
+                        'output0', 'output1', 'pid_p', 'pid_i', 'pid_d', 'pid_int', 'permanent_manual'] + list(SCHEDULE_FIELDS))
 
     @staticmethod
     def serialize(thermostat_dto, fields):  # type: (ThermostatDTO, Optional[List[str]]) -> Dict
@@ -46,8 +65,9 @@ class ThermostatSerializer(object):
                 'pid_d': Toolbox.denonify(thermostat_dto.pid_d, ThermostatSerializer.BYTE_MAX),
                 'pid_int': Toolbox.denonify(thermostat_dto.pid_int, ThermostatSerializer.BYTE_MAX),
                 'permanent_manual': thermostat_dto.permanent_manual}
-        for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-            field = 'auto_{0}'.format(day)
+        for field in ThermostatSerializer.SCHEDULE_FIELDS:
+            if fields is not None and field not in fields:
+                continue  # Would be filtered out anyway
             dto_data = getattr(thermostat_dto, field)  # type: ThermostatScheduleDTO
             if dto_data is None:
                 continue
@@ -67,25 +87,9 @@ class ThermostatSerializer(object):
         loaded_fields += SerializerToolbox.deserialize(
             dto=heating_thermostat_dto,  # Referenced
             api_data=api_data,
-            mapping={'name': ('name', None),
-                     'permanent_manual': ('permanent_manual', None),
-                     'setp0': ('setp0', None),
-                     'setp1': ('setp1', None),
-                     'setp2': ('setp2', None),
-                     'setp3': ('setp3', None),
-                     'setp4': ('setp4', None),
-                     'setp5': ('setp5', None),
-                     'room': ('room', ThermostatSerializer.BYTE_MAX),
-                     'sensor': ('sensor', ThermostatSerializer.BYTE_MAX),
-                     'output0': ('output0', ThermostatSerializer.BYTE_MAX),
-                     'output1': ('output1', ThermostatSerializer.BYTE_MAX),
-                     'pid_p': ('pid_p', ThermostatSerializer.BYTE_MAX),
-                     'pid_i': ('pid_i', ThermostatSerializer.BYTE_MAX),
-                     'pid_d': ('pid_d', ThermostatSerializer.BYTE_MAX),
-                     'pid_int': ('pid_int', ThermostatSerializer.BYTE_MAX)}
+            mapping=ThermostatSerializer.DESERIALIZE_MAPPING
         )
-        for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-            field = 'auto_{0}'.format(day)
+        for field in ThermostatSerializer.SCHEDULE_FIELDS:
             if field not in api_data:
                 continue
             loaded_fields.append(field)
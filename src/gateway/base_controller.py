@@ -16,7 +16,9 @@
 Base Controller
 """
 from __future__ import absolute_import
+import copy
 import logging
+from contextlib import contextmanager
 from ioc import INJECTED, Inject
 from gateway.daemon_thread import DaemonThread
 from gateway.hal.master_event import MasterEvent
@@ -24,7 +26,7 @@ from gateway.hal.master_controller import MasterController
 from gateway.models import BaseModel
 
 if False:  # MYPY
-    from typing import Optional, Callable, Type, List
+    from typing import Any, Dict, Optional, Callable, Type, List, Tuple
     from gateway.hal.master_event import MasterEvent
     from gateway.maintenance_controller import MaintenanceController
 
@@ -41,17 +43,54 @@ class SyncStructure(object):
 class BaseController(object):
 
     SYNC_STRUCTURES = None  # type: Optional[List[SyncStructure]]
+    # Shared by all controllers, as e.g. removing a room changes the DTOs of most of them
+    _cache_generation = 0
 
     @Inject
     def __init__(self, master_controller, maintenance_controller=INJECTED):
         self._master_controller = master_controller  # type: MasterController
         self._maintenance_controller = maintenance_controller  # type: MaintenanceController
         self._sync_thread = None  # type: Optional[DaemonThread]
+        self._dto_cache = {}  # type: Dict[str, Tuple[int, List[Any], Dict[int, Any]]]
         self._master_controller.subscribe_event(self._handle_master_event)
         self._maintenance_controller.subscribe_maintenance_stopped(self.sync_orm)
 
+    @staticmethod
+    def invalidate_caches():  # type: () -> None
+        """ Drops the cached DTOs of all controllers, to be called whenever configuration might have changed """
+        BaseController._cache_generation += 1
+
+    @staticmethod
+    @contextmanager
+    def invalidating_caches():
+        """ Invalidates the cached DTOs when the wrapped save ends, also when it failed halfway """
+        try:
+            yield
+        finally:
+            BaseController.invalidate_caches()
+
+    def _load_cached(self, key, load):  # type: (str, Callable[[], List[Any]]) -> List[Any]
+        """ Returns copies of the cached DTOs, so callers can't corrupt the cache by changing them """
+        generation = BaseController._cache_generation
+        entry = self._dto_cache.get(key)
+        if entry is None or entry[0] != generation:
+            dtos = load()
+            # Loads during an invalidation are stored with the old generation
+            entry = (generation, dtos, dict((dto.id, dto) for dto in dtos))
+            self._dto_cache[key] = entry
+        return copy.deepcopy(entry[1])
+
+    def _get_cached(self, key, dto_id):  # type: (str, int) -> Optional[Any]
+        """ Returns a single DTO from a still valid list cache, without loading it when it isn't """
+        entry = self._dto_cache.get(key)
+        if entry is None or entry[0] != BaseController._cache_generation:
+            return None
+        dto = entry[2].get(dto_id)
+        return None if dto is None else copy.deepcopy(dto)
+
     def _handle_master_event(self, master_event):  # type: (MasterEvent) -> None
         if master_event.type in [MasterEvent.Types.EEPROM_CHANGE, MasterEvent.Types.MODULE_DISCOVERY]:
+            BaseController.invalidate_caches()
             if self._sync_thread is not None:
                 self._sync_thread.request_single_run()
 
@@ -89,3 +128,4 @@ class BaseController(object):
                 logger.info('ORM sync ({0}): completed'.format(orm_model.__name__))
             except Exception:
                 logger.exception('ORM sync ({0}): Failed'.format(orm_model.__name__))
+        BaseController.invalidate_caches()
@@ -19,8 +19,16 @@ Base DTO
 
 
 class BaseDTO(object):
+    __slots__ = ()  # Allows subclasses to declare their fields as slots
+
+    def _get_data(self):
+        data = getattr(self, '__dict__', None)
+        if data is None:
+            data = dict((field, getattr(self, field)) for field in self.__slots__)
+        return data
+
     def __str__(self):
-        return str(self.__dict__)
+        return str(self._get_data())
 
     def __repr__(self):
-        return str(self.__dict__)
+        return str(self._get_data())
@@ -23,6 +23,8 @@ if False:  # MYPY
 
 
 class FloorDTO(BaseDTO):
+    __slots__ = ['id', 'name']
+
     def __init__(self, id, name=None):
         self.id = id  # type: int
         self.name = name  # type: Optional[str]
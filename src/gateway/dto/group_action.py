@@ -23,6 +23,8 @@ if False:  # MYPY
 
 
 class GroupActionDTO(BaseDTO):
+    __slots__ = ['id', 'name', 'actions']
+
     def __init__(self, id, name='', actions=None):
         # The argument `actions` is None since you should not set a reference type as default value
         self.id = id  # type: int
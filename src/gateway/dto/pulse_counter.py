@@ -23,6 +23,8 @@ if False:  # MYPY
 
 
 class PulseCounterDTO(BaseDTO):
+    __slots__ = ['id', 'name', 'input_id', 'room', 'persistent']
+
     def __init__(self, id, name='', room=None, input_id=None, persistent=False):
         self.id = id  # type: int
         self.name = name  # type: str
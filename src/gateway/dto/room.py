@@ -24,6 +24,8 @@ if False:  # MYPY
 
 
 class RoomDTO(BaseDTO):
+    __slots__ = ['id', 'name', 'floor']
+
     def __init__(self, id, name=None, floor=None):
         self.id = id  # type: int
         self.name = name  # type: Optional[str]
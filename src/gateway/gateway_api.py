@@ -31,6 +31,7 @@ from six.moves.configparser import ConfigParser
 
 import constants
 from bus.om_bus_events import OMBusEvents
+from gateway.base_controller import BaseController
 from gateway.hal.master_controller import MasterController
 from ioc import INJECTED, Inject, Injectable, Singleton
 from platform_utils import System
@@ -354,7 +355,7 @@ class GatewayApi(object):
         Get a backup (tar) of the master eeprom, the sqlite databases and the plugins
 
         :returns: Tar containing multiple files: master.eep, config.db, scheduled.db, power.db,
-        eeprom_extensions.db, metrics.db and plugins as a string of bytes.
+        eeprom_extensions.db, metrics.db and plugins as a generator of byte chunks.
         """
         _ = self  # Not static for consistency
 
@@ -411,20 +412,31 @@ class GatewayApi(object):
             retcode = subprocess.call('cd {0}; tar cf backup.tar *'.format(tmp_dir), shell=True)
             if retcode != 0:
                 raise Exception('The backup tar could not be created.')
+        except Exception:
+            shutil.rmtree(tmp_dir)
+            raise
 
-            with open('{0}/backup.tar'.format(tmp_dir), 'r') as backup_file:
-                return backup_file.read()
+        def read_backup():
+            """ Reads the (possibly large) tar in chunks, cleaning up once it's sent """
+            try:
+                with open('{0}/backup.tar'.format(tmp_dir), 'rb') as backup_file:
+                    while True:
+                        chunk = backup_file.read(65536)
+                        if not chunk:
+                            break
+                        yield chunk
+            finally:
+                shutil.rmtree(tmp_dir)
 
-        finally:
-            shutil.rmtree(tmp_dir)
+        return read_backup()
 
     def restore_full_backup(self, data):
         """
         Restore a full backup containing the master eeprom and the sqlite databases.
 
         :param data: The backup to restore.
-        :type data: Tar containing multiple files: master.eep, config.db, scheduled.db, power.db,
-        eeprom_extensions.db, metrics.db and plugins as a string of bytes.
+        :type data: File-like object with a tar containing multiple files: master.eep, config.db, scheduled.db,
+        power.db, eeprom_extensions.db, metrics.db and plugins.
         :returns: dict with 'output' key.
         """
         import glob
@@ -436,7 +448,7 @@ class GatewayApi(object):
         tmp_sqlite_dir = '{0}/sqlite'.format(tmp_dir)
         try:
             with open('{0}/backup.tar'.format(tmp_dir), 'wb') as backup_file:
-                backup_file.write(data)
+                shutil.copyfileobj(data, backup_file, 65536)  # Copied in chunks, the backup can be large
 
             retcode = subprocess.call('cd {0}; tar xf backup.tar'.format(tmp_dir), shell=True)
             if retcode != 0:
@@ -504,7 +516,8 @@ class GatewayApi(object):
         return self.__master_controller.get_backup()
 
     def master_restore(self, data):
-        return self.__master_controller.restore(data)
+        with BaseController.invalidating_caches():
+            return self.__master_controller.restore(data)
 
     # Error functions
 
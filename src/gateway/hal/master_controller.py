@@ -32,7 +32,7 @@ class MasterController(object):
 
     def __init__(self, master_communicator):
         self._master_communicator = master_communicator
-        self._event_callbacks = []  # type: List[Callable[[MasterEvent], None]]
+        self._event_callbacks = ()  # type: Tuple[Callable[[MasterEvent], None], ...]
 
     #######################
     # Internal management #
@@ -52,7 +52,8 @@ class MasterController(object):
     #################
 
     def subscribe_event(self, callback):  # type: (Callable[[MasterEvent], None]) -> None
-        self._event_callbacks.append(callback)
+        # Copy-on-write, so the event dispatchers can iterate the tuple without locking or copying
+        self._event_callbacks = self._event_callbacks + (callback,)
 
     ##############
     # Public API #
@@ -59,6 +59,9 @@ if False:  # MYPY
 
 logger = logging.getLogger("openmotics")
 
+# Module types of 'real' inputs, as opposed to e.g. temperature modules
+_INPUT_MODULE_TYPES = frozenset(['i', 'I'])
+
 
 class MasterClassicController(MasterController):
 
@@ -338,14 +341,14 @@ class MasterClassicController(MasterController):
 
     def load_input(self, input_id):  # type: (int) -> InputDTO
         classic_object = self._eeprom_controller.read(eeprom_models.InputConfiguration, input_id)
-        if classic_object.module_type not in ['i', 'I']:  # Only return 'real' inputs
+        if classic_object.module_type not in _INPUT_MODULE_TYPES:  # Only return 'real' inputs
             raise TypeError('The given id {0} is not an input, but {1}'.format(input_id, classic_object.module_type))
         return InputMapper.orm_to_dto(classic_object)
 
     def load_inputs(self):  # type: () -> List[InputDTO]
         return [InputMapper.orm_to_dto(o)
                 for o in self._eeprom_controller.read_all(eeprom_models.InputConfiguration)
-                if o.module_type in ['i', 'I']]  # Only return 'real' inputs
+                if o.module_type in _INPUT_MODULE_TYPES]  # Only return 'real' inputs
 
     def save_inputs(self, inputs):  # type: (List[Tuple[InputDTO, List[str]]]) -> None
         batch = []
@@ -364,7 +367,7 @@ class MasterClassicController(MasterController):
             for i in range(number_of_input_modules):
                 # we could be dealing with e.g. a temperature module, skip those
                 module_type = self.get_input_module_type(i)
-                if module_type not in ['i', 'I']:
+                if module_type not in _INPUT_MODULE_TYPES:
                     continue
                 result = self._master_communicator.do_command(master_api.read_input_module(self._master_version), {'input_module_nr': i})
                 module_status = result['input_status']
@@ -815,14 +818,14 @@ class MasterClassicController(MasterController):
         :returns: String of bytes (size = 64kb).
         """
         retry = None
-        output = ""
+        output = []  # Joined at the end, instead of copying the growing backup for every bank
         bank = 0
         while bank < 256:
             try:
-                output += self._master_communicator.do_command(
+                output.append(self._master_communicator.do_command(
                     master_api.eeprom_list(),
                     {'bank': bank}
-                )['data']
+                )['data'])
                 bank += 1
             except CommunicationTimedOutException:
                 if retry == bank:
@@ -830,7 +833,7 @@ class MasterClassicController(MasterController):
                 retry = bank
                 logger.warning('Got timeout reading bank {0}. Retrying...'.format(bank))
                 time.sleep(2)  # Doing heavy reads on eeprom can exhaust the master. Give it a bit room to breathe.
-        return output
+        return ''.join(output)
 
     def factory_reset(self):
         # Wipe master EEPROM
@@ -18,7 +18,8 @@ Module for communicating with the Master
 from __future__ import absolute_import
 import logging
 import time
-from threading import Thread
+from collections import deque
+from threading import Event, Thread
 from peewee import DoesNotExist
 from datetime import datetime
 
@@ -44,17 +45,36 @@ from master.core.errors import Error
 from master.core.events import Event as MasterCoreEvent
 from master.core.memory_file import MemoryTypes, MemoryFile
 from master.core.memory_models import (
-    GlobalConfiguration, InputConfiguration, OutputConfiguration,
-    SensorConfiguration, ShutterConfiguration
+    GlobalConfiguration, InputConfiguration, InputModuleConfiguration,
+    OutputConfiguration, OutputModuleConfiguration, SensorConfiguration,
+    ShutterConfiguration
 )
+from master.core.memory_types import MemoryActivator
 from master.core.group_action import GroupActionController
 from serial_utils import CommunicationTimedOutException
+from six.moves import range
 
 if False:  # MYPY
-    from typing import Any, Dict, List, Tuple
+    from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger("openmotics")
 
+# Bit values (LSB first) for every possible byte value
+_BYTE_BITS = tuple(tuple((b >> j) & 0x1 for j in range(8)) for b in range(256))
+# Indexes of the set bits for every possible byte value
+_SET_BITS = tuple(tuple(j for j in range(8) if (b >> j) & 0x1) for b in range(256))
+# Location shared by all generated events, treat as read-only. TODO: missing room
+_DEFAULT_LOCATION = {'room_id': 255}
+# Events that are interesting for debug purposes, but too frequent to log
+_QUIET_EVENTS = frozenset([MasterCoreEvent.Types.LED_BLINK,
+                           MasterCoreEvent.Types.LED_ON,
+                           MasterCoreEvent.Types.BUTTON_PRESS])
+# Shutter composition field names on the OutputModuleConfiguration, per output set
+_SHUTTER_DIRECTION_FIELDS = {'01': 'set_01_direction', '23': 'set_23_direction',
+                             '45': 'set_45_direction', '67': 'set_67_direction'}
+_SHUTTER_OUTPUTS_FIELDS = {'01': 'are_01_outputs', '23': 'are_23_outputs',
+                           '45': 'are_45_outputs', '67': 'are_67_outputs'}
+
 
 class MasterCoreController(MasterController):
 
@@ -65,6 +85,7 @@ class MasterCoreController(MasterController):
         self._ucan_communicator = ucan_communicator  # type: UCANCommunicator
         self._memory_files = memory_files  # type: Dict[str, MemoryFile]
         self._synchronization_thread = Thread(target=self._synchronize, name='CoreMasterSynchronization')
+        self._synchronization_wakeup = Event()
         self._master_online = False
         self._input_state = MasterInputState()
         self._output_interval = 600
@@ -77,6 +98,14 @@ class MasterCoreController(MasterController):
         self._shutters_last_updated = 0
         self._time_last_updated = 0
         self._output_shutter_map = {}  # type: Dict[int, int]
+        self._module_counts = None  # type: Optional[Dict[str, int]]
+        self._shutter_outputs = {}  # type: Dict[int, bool]
+        self._shutter_directions = {}  # type: Dict[int, bool]
+        self._shutter_states = {}  # type: Dict[int, str]
+        self._states_requested = False
+        self._event_handlers = {MasterCoreEvent.Types.OUTPUT: self._handle_output_event,
+                                MasterCoreEvent.Types.INPUT: self._handle_input_event,
+                                MasterCoreEvent.Types.SENSOR: self._handle_sensor_event}  # type: Dict[str, Callable[[MasterCoreEvent], None]]
 
         self._memory_files[MemoryTypes.EEPROM].subscribe_eeprom_change(self._handle_eeprom_change)
 
@@ -96,10 +125,15 @@ class MasterCoreController(MasterController):
 
     def _handle_eeprom_change(self):
         self._output_shutter_map = {}
+        self._module_counts = None
+        self._shutter_outputs = {}
+        self._shutter_directions = {}
+        self._shutter_states = {}
         self._shutters_last_updated = 0
         self._sensor_last_updated = 0
         self._input_last_updated = 0
         self._output_last_updated = 0
+        self._synchronization_wakeup.set()
         event = MasterEvent(event_type=MasterEvent.Types.EEPROM_CHANGE,
                             data=None)
         for callback in self._event_callbacks:
@@ -108,47 +142,60 @@ class MasterCoreController(MasterController):
     def _handle_event(self, data):
         # type: (Dict[str,Any]) -> None
         core_event = MasterCoreEvent(data)
-        if core_event.type not in [MasterCoreEvent.Types.LED_BLINK,
-                                   MasterCoreEvent.Types.LED_ON,
-                                   MasterCoreEvent.Types.BUTTON_PRESS]:
+        if core_event.type not in _QUIET_EVENTS:
             # Interesting for debug purposes, but not for everything
             logger.info('Got master event: {0}'.format(core_event))
-        if core_event.type == MasterCoreEvent.Types.OUTPUT:
-            # Update internal state cache
-            output_id = core_event.data['output']
-            timer_value = core_event.data['timer_value']
-            if timer_value is not None:
-                timer_value *= core_event.data['timer_factor']
-            self._process_new_output_state(output_id=output_id,
-                                           status=core_event.data['status'],
-                                           timer=timer_value,
-                                           dimmer=core_event.data['dimmer_value'])
-        elif core_event.type == MasterCoreEvent.Types.INPUT:
-            event = self._input_state.handle_event(core_event)
-            for callback in self._event_callbacks:
-                callback(event)
-        elif core_event.type == MasterCoreEvent.Types.SENSOR:
-            sensor_id = core_event.data['sensor']
-            if sensor_id not in self._sensor_states:
-                return
-            self._sensor_states[sensor_id][core_event.data['type']] = core_event.data['value']
+        handler = self._event_handlers.get(core_event.type)
+        if handler is not None:
+            handler(core_event)
+
+    def _handle_output_event(self, core_event):
+        # type: (MasterCoreEvent) -> None
+        # Update internal state cache
+        data = core_event.data
+        timer_value = data['timer_value']
+        if timer_value is not None:
+            timer_value *= data['timer_factor']
+        self._process_new_output_state(output_id=data['output'],
+                                       status=data['status'],
+                                       timer=timer_value,
+                                       dimmer=data['dimmer_value'])
+
+    def _handle_input_event(self, core_event):
+        # type: (MasterCoreEvent) -> None
+        event = self._input_state.handle_event(core_event)
+        for callback in self._event_callbacks:
+            callback(event)
+
+    def _handle_sensor_event(self, core_event):
+        # type: (MasterCoreEvent) -> None
+        data = core_event.data
+        sensor_id = data['sensor']
+        if sensor_id not in self._sensor_states:
+            return
+        self._sensor_states[sensor_id][data['type']] = data['value']
 
     def _process_new_output_state(self, output_id, status, timer, dimmer):
-        new_state = {'id': output_id,
-                     'status': 1 if status else 0,
-                     'ctimer': timer,
-                     'dimmer': dimmer}
+        normalized_status = 1 if status else 0
         current_state = self._output_states.get(output_id)
-        if current_state is not None:
-            if current_state['status'] == new_state['status'] and current_state['dimmer'] == new_state['dimmer']:
+        if current_state is None:
+            self._output_states[output_id] = {'id': output_id,
+                                              'status': normalized_status,
+                                              'ctimer': timer,
+                                              'dimmer': dimmer}
+        else:
+            # The state records are updated in place, they are only allocated once per output
+            current_state['ctimer'] = timer
+            if current_state['status'] == normalized_status and current_state['dimmer'] == dimmer:
                 return
-        self._output_states[output_id] = new_state
+            current_state['status'] = normalized_status
+            current_state['dimmer'] = dimmer
         # Generate generic event
         event = MasterEvent(event_type=MasterEvent.Types.OUTPUT_CHANGE,
                             data={'id': output_id,
                                   'status': {'on': status,
                                              'value': dimmer},
-                                  'location': {'room_id': 255}})  # TODO: Missing room
+                                  'location': _DEFAULT_LOCATION})
         for callback in self._event_callbacks:
             callback(event)
         # Handle shutter events, if needed
@@ -160,21 +207,33 @@ class MasterCoreController(MasterController):
         # type: () -> None
         while True:
             try:
+                self._synchronization_wakeup.clear()
+                now = time.time()
                 # Refresh if required
-                if self._time_last_updated + 300 < time.time():
+                if self._time_last_updated + 300 < now:
                     self._check_master_time()
-                if self._refresh_input_states():
-                    self._set_master_state(True)
-                if self._output_last_updated + self._output_interval < time.time():
-                    self._refresh_output_states()
-                    self._set_master_state(True)
-                if self._sensor_last_updated + self._sensor_interval < time.time():
-                    self._refresh_sensor_states()
-                    self._set_master_state(True)
-                if self._shutters_last_updated + self._shutters_interval < time.time():
-                    self._refresh_shutter_states()
-                    self._set_master_state(True)
-                time.sleep(1)
+                next_refresh = self._time_last_updated + 300
+                # The states only need to be refreshed if somebody is interested in them
+                if self._event_callbacks or self._states_requested:
+                    self._states_requested = False
+                    if self._refresh_input_states(now):
+                        self._set_master_state(True)
+                    if self._output_last_updated + self._output_interval < now:
+                        self._refresh_output_states()
+                        self._set_master_state(True)
+                    if self._sensor_last_updated + self._sensor_interval < now:
+                        self._refresh_sensor_states()
+                        self._set_master_state(True)
+                    if self._shutters_last_updated + self._shutters_interval < now:
+                        self._refresh_shutter_states()
+                        self._set_master_state(True)
+                    next_refresh = min(next_refresh,
+                                       self._input_state.next_refresh(),
+                                       self._output_last_updated + self._output_interval,
+                                       self._sensor_last_updated + self._sensor_interval,
+                                       self._shutters_last_updated + self._shutters_interval)
+                # Sleep until the next refresh is due, or until the caches are invalidated
+                self._synchronization_wakeup.wait(max(1.0, next_refresh - time.time()))
             except CommunicationTimedOutException:
                 logger.error('Got communication timeout during synchronization, waiting 10 seconds.')
                 self._set_master_state(False)
@@ -186,13 +245,31 @@ class MasterCoreController(MasterController):
                 logger.exception('Unexpected error during synchronization: {0}'.format(ex))
                 time.sleep(10)
 
+    def _request_states(self):
+        # type: () -> None
+        """ Marks the states as used, waking up the synchronization so they don't go stale """
+        if not self._states_requested:
+            self._states_requested = True
+            self._synchronization_wakeup.set()
+
     def _set_master_state(self, online):
         if online != self._master_online:
             self._master_online = online
 
+    def _get_module_counts(self):
+        # type: () -> Dict[str, int]
+        """ Returns the amount of modules per type. Cached until the next eeprom change """
+        module_counts = self._module_counts
+        if module_counts is None:
+            cmd = CoreAPI.general_configuration_number_of_modules()
+            module_counts = self._master_communicator.do_command(cmd, {})
+            self._module_counts = module_counts
+        return module_counts
+
     def _enumerate_io_modules(self, module_type, amount_per_module=8):
-        cmd = CoreAPI.general_configuration_number_of_modules()
-        module_count = self._master_communicator.do_command(cmd, {})[module_type]
+        # type: (str, int) -> Iterable[int]
+        """ Enumerates the ids of the given module type, without a master round-trip once the counts are cached """
+        module_count = self._get_module_counts()[module_type]
         return range(module_count * amount_per_module)
 
     def _check_master_time(self):
@@ -244,6 +321,11 @@ class MasterCoreController(MasterController):
         """ Set the plugin controller. """
         pass  # TODO: implement
 
+    def subscribe_event(self, callback):  # type: (Callable[[MasterEvent], None]) -> None
+        super(MasterCoreController, self).subscribe_event(callback)
+        self._shutter_states = {}  # Make sure the new subscriber receives all shutter states
+        self._synchronization_wakeup.set()  # Make sure the states get refreshed
+
     def _log_stats(self):
         def _default_if_255(value, default):
             return value if value != 255 else default
@@ -283,6 +365,7 @@ class MasterCoreController(MasterController):
         # type: () -> None
         self._input_last_updated = 0
         self._output_last_updated = 0
+        self._synchronization_wakeup.set()
 
     def get_firmware_version(self):
         version = self._master_communicator.do_command(CoreAPI.get_firmware_version(), {})['version']
@@ -314,10 +397,12 @@ class MasterCoreController(MasterController):
 
     def get_inputs_with_status(self):
         # type: () -> List[Dict[str,Any]]
+        self._request_states()
         return self._input_state.get_inputs()
 
     def get_recent_inputs(self):
         # type: () -> List[int]
+        self._request_states()
         return self._input_state.get_recent()
 
     def load_input(self, input_id):  # type: (int) -> InputDTO
@@ -325,33 +410,45 @@ class MasterCoreController(MasterController):
         return InputMapper.orm_to_dto(input_)
 
     def load_inputs(self):  # type: () -> List[InputDTO]
+        input_ids = self._enumerate_io_modules('input')
+        InputConfiguration.preload(input_ids)
+        InputModuleConfiguration.preload(range(self._get_module_counts()['input']))  # For the module types
         inputs = []
-        for i in self._enumerate_io_modules('input'):
+        for i in input_ids:
             inputs.append(self.load_input(i))
         return inputs
 
     def save_inputs(self, inputs):  # type: (List[Tuple[InputDTO, List[str]]]) -> None
         for input_dto, fields in inputs:
             input_ = InputMapper.dto_to_orm(input_dto, fields)
-            input_.save()  # TODO: Batch saving - postpone eeprom activate if relevant for the Core
+            input_.save(activate=False)
+        MemoryActivator.activate()
 
-    def _refresh_input_states(self):
-        # type: () -> bool
-        refresh = self._input_state.should_refresh()
+    def _refresh_input_states(self, now=None):
+        # type: (Optional[float]) -> bool
+        refresh = self._input_state.should_refresh(now)
         if refresh:
             cmd = CoreAPI.device_information_list_inputs()
             data = self._master_communicator.do_command(cmd, {})
             if data is not None:
+                callbacks = self._event_callbacks
                 for event in self._input_state.refresh(data['information']):
-                    for callback in self._event_callbacks:
+                    for callback in callbacks:
                         callback(event)
         return refresh
 
     # Outputs
 
+    def _is_shutter_output(self, output_id):  # type: (int) -> bool
+        """ Returns whether the output is used by a shutter. Cached until the next eeprom change """
+        is_shutter = self._shutter_outputs.get(output_id)
+        if is_shutter is None:
+            is_shutter = OutputConfiguration(output_id).is_shutter
+            self._shutter_outputs[output_id] = is_shutter
+        return is_shutter
+
     def set_output(self, output_id, state, dimmer=None, timer=None):
-        output = OutputConfiguration(output_id)
-        if output.is_shutter:
+        if self._is_shutter_output(output_id):
             # Shutter outputs cannot be controlled
             return
         _ = dimmer, timer  # TODO: Use `dimmer` and `timer`
@@ -361,8 +458,7 @@ class MasterCoreController(MasterController):
                                                                       'extra_parameter': 0})
 
     def toggle_output(self, output_id):
-        output = OutputConfiguration(output_id)
-        if output.is_shutter:
+        if self._is_shutter_output(output_id):
             # Shutter outputs cannot be controlled
             return
         self._master_communicator.do_command(CoreAPI.basic_action(), {'type': 0, 'action': 16,
@@ -370,15 +466,17 @@ class MasterCoreController(MasterController):
                                                                       'extra_parameter': 0})
 
     def load_output(self, output_id):  # type: (int) -> OutputDTO
-        output = OutputConfiguration(output_id)
-        if output.is_shutter:
+        if self._is_shutter_output(output_id):
             # Outputs that are used by a shutter are returned as unconfigured (read-only) outputs
-            return OutputDTO(id=output.id)
-        return OutputMapper.orm_to_dto(output)
+            return OutputDTO(id=output_id)
+        return OutputMapper.orm_to_dto(OutputConfiguration(output_id))
 
     def load_outputs(self):  # type: () -> List[OutputDTO]
+        output_ids = self._enumerate_io_modules('output')
+        OutputConfiguration.preload(output_ids)
+        OutputModuleConfiguration.preload(range(self._get_module_counts()['output']))
         outputs = []
-        for i in self._enumerate_io_modules('output'):
+        for i in output_ids:
             outputs.append(self.load_output(i))
         return outputs
 
@@ -388,18 +486,26 @@ class MasterCoreController(MasterController):
             if output.is_shutter:
                 # Shutter outputs cannot be changed
                 continue
-            output.save()  # TODO: Batch saving - postpone eeprom activate if relevant for the Core
+            output.save(activate=False)
+        MemoryActivator.activate()
 
     def get_output_status(self, output_id):
+        self._request_states()
         return self._output_states.get(output_id)
 
     def get_output_statuses(self):
+        self._request_states()
         return list(self._output_states.values())
 
     def _refresh_output_states(self):
-        for i in self._enumerate_io_modules('output'):
-            state = self._master_communicator.do_command(CoreAPI.output_detail(), {'device_nr': i})
-            self._process_new_output_state(i, state['status'], state['timer'], state['dimmer'])
+        # The details of all outputs of a module are requested in a single round-trip
+        output_ids = list(self._enumerate_io_modules('output'))
+        for start in range(0, len(output_ids), 8):
+            module_output_ids = output_ids[start:start + 8]
+            states = self._master_communicator.do_commands([(CoreAPI.output_detail(), {'device_nr': i})
+                                                            for i in module_output_ids])
+            for i, state in zip(module_output_ids, states):
+                self._process_new_output_state(i, state['status'], state['timer'], state['dimmer'])
         self._output_last_updated = time.time()
 
     # Shutters
@@ -424,7 +530,7 @@ class MasterCoreController(MasterController):
         shutter_dto = ShutterMapper.orm_to_dto(shutter)
         # Load information that is set on the Output(Module)Configuration
         output_module = OutputConfiguration(shutter.outputs.output_0).module
-        if getattr(output_module.shutter_config, 'set_{0}_direction'.format(shutter.output_set)):
+        if getattr(output_module.shutter_config, _SHUTTER_DIRECTION_FIELDS[shutter.output_set]):
             shutter_dto.up_down_config = 1
         else:
             shutter_dto.up_down_config = 0
@@ -436,14 +542,19 @@ class MasterCoreController(MasterController):
         # but instead a virtual layer over physical Output modules. For easy backwards compatible
         # implementation, a Shutter will map 1-to-1 to the Outputs with the same ID. This means we only need
         # to emulate such a Shutter module foreach Output module.
+        shutter_ids = self._enumerate_io_modules('output', amount_per_module=4)
+        ShutterConfiguration.preload(shutter_ids)
+        OutputModuleConfiguration.preload(range(self._get_module_counts()['output']))
         shutters = []
-        for shutter_id in self._enumerate_io_modules('output', amount_per_module=4):
+        for shutter_id in shutter_ids:
             shutters.append(self.load_shutter(shutter_id))
         return shutters
 
     def save_shutters(self, shutters):  # type: (List[Tuple[ShutterDTO, List[str]]]) -> None
-        # TODO: Batch saving - postpone eeprom activate if relevant for the Core
         # TODO: Atomic saving
+        self._shutter_outputs = {}
+        self._shutter_directions = {}
+        self._shutter_states = {}
         for shutter_dto, fields in shutters:
             # Configure shutter
             shutter = ShutterMapper.dto_to_orm(shutter_dto, fields)
@@ -458,33 +569,42 @@ class MasterCoreController(MasterController):
                 self._output_shutter_map.pop(shutter.outputs.output_1, None)
                 shutter.outputs.output_0 = 255 * 2
                 is_configured = False
-            shutter.save()
+            shutter.save(activate=False)
             # Mark related Outputs as "occupied by shutter"
             output_module = OutputConfiguration(shutter_dto.id * 2).module
-            setattr(output_module.shutter_config, 'are_{0}_outputs'.format(shutter.output_set), not is_configured)
-            setattr(output_module.shutter_config, 'set_{0}_direction'.format(shutter.output_set), shutter_dto.up_down_config == 1)
-            output_module.save()
+            output_set = shutter.output_set
+            setattr(output_module.shutter_config, _SHUTTER_OUTPUTS_FIELDS[output_set], not is_configured)
+            setattr(output_module.shutter_config, _SHUTTER_DIRECTION_FIELDS[output_set], shutter_dto.up_down_config == 1)
+            output_module.save(activate=False)
+        MemoryActivator.activate()
 
     def _refresh_shutter_states(self):
         for shutter_id in self._enumerate_io_modules('output', amount_per_module=4):
             shutter = ShutterConfiguration(shutter_id)
-            if shutter.outputs.output_0 != 255 * 2:
-                self._output_shutter_map[shutter.outputs.output_0] = shutter.id
-                self._output_shutter_map[shutter.outputs.output_1] = shutter.id
-            else:
-                self._output_shutter_map.pop(shutter.outputs.output_0, None)
-                self._output_shutter_map.pop(shutter.outputs.output_1, None)
-            self._refresh_shutter_state(shutter_id)
+            output_0, output_1 = shutter.outputs.output_0, shutter.outputs.output_1
+            if output_0 == 255 * 2:
+                self._output_shutter_map.pop(output_0, None)
+                self._output_shutter_map.pop(output_1, None)
+                continue
+            self._output_shutter_map[output_0] = shutter.id
+            self._output_shutter_map[output_1] = shutter.id
+            self._refresh_shutter_state(shutter_id, shutter=shutter)
         self._shutters_last_updated = time.time()
 
-    def _refresh_shutter_state(self, shutter_id):
-        shutter = ShutterConfiguration(shutter_id)
+    def _refresh_shutter_state(self, shutter_id, shutter=None):
+        # type: (int, Optional[ShutterConfiguration]) -> None
+        if shutter is None:
+            shutter = ShutterConfiguration(shutter_id)
         if shutter.outputs.output_0 == 255 * 2:
             return
         output_0_on = self._output_states.get(shutter.outputs.output_0, {}).get('status') == 1
         output_1_on = self._output_states.get(shutter.outputs.output_1, {}).get('status') == 1
-        output_module = OutputConfiguration(shutter.outputs.output_0).module
-        if getattr(output_module.shutter_config, 'set_{0}_direction'.format(shutter.output_set)):
+        direction = self._shutter_directions.get(shutter_id)
+        if direction is None:
+            output_module = OutputConfiguration(shutter.outputs.output_0).module
+            direction = getattr(output_module.shutter_config, _SHUTTER_DIRECTION_FIELDS[shutter.output_set])
+            self._shutter_directions[shutter_id] = direction
+        if direction:
             up, down = output_0_on, output_1_on
         else:
             up, down = output_1_on, output_0_on
@@ -496,10 +616,14 @@ class MasterCoreController(MasterController):
         else:  # Both are off or - unlikely - both are on
             state = ShutterEnums.State.STOPPED
 
+        # Both outputs of a shutter change for a single transition, only report actual changes
+        if self._shutter_states.get(shutter_id) == state:
+            return
+        self._shutter_states[shutter_id] = state
         for callback in self._event_callbacks:
             event_data = {'id': shutter_id,
                           'status': state,
-                          'location': {'room_id': 255}}  # TODO: rooms
+                          'location': _DEFAULT_LOCATION}
             callback(MasterEvent(event_type=MasterEvent.Types.SHUTTER_CHANGE, data=event_data))
 
     def shutter_group_up(self, shutter_group_id):  # type: (int) -> None
@@ -551,61 +675,68 @@ class MasterCoreController(MasterController):
 
     # Sensors
 
+    def _get_sensor_values(self, field):  # type: (str) -> List[Any]
+        self._request_states()
+        sensor_states = self._sensor_states
+        return [sensor_states.get(sensor_id, {}).get(field)
+                for sensor_id in range(self._get_module_counts()['sensor'] * 8)]
+
     def get_sensor_temperature(self, sensor_id):
+        self._request_states()
         return self._sensor_states.get(sensor_id, {}).get('TEMPERATURE')
 
     def get_sensors_temperature(self):
-        amount_sensor_modules = self._master_communicator.do_command(CoreAPI.general_configuration_number_of_modules(), {})['sensor']
-        temperatures = []
-        for sensor_id in range(amount_sensor_modules * 8):
-            temperatures.append(self.get_sensor_temperature(sensor_id))
-        return temperatures
+        return self._get_sensor_values('TEMPERATURE')
 
     def get_sensor_humidity(self, sensor_id):
+        self._request_states()
         return self._sensor_states.get(sensor_id, {}).get('HUMIDITY')
 
     def get_sensors_humidity(self):
-        amount_sensor_modules = self._master_communicator.do_command(CoreAPI.general_configuration_number_of_modules(), {})['sensor']
-        humidities = []
-        for sensor_id in range(amount_sensor_modules * 8):
-            humidities.append(self.get_sensor_humidity(sensor_id))
-        return humidities
+        return self._get_sensor_values('HUMIDITY')
 
-    def get_sensor_brightness(self, sensor_id):
+    @staticmethod
+    def _brightness_to_percentage(brightness):  # type: (Optional[int]) -> Optional[int]
         # TODO: This is a lux value and must somehow be converted to legacy percentage
-        brightness = self._sensor_states.get(sensor_id, {}).get('BRIGHTNESS')
-        if brightness in [None, 65535]:
+        if brightness is None or brightness == 65535:
             return None
-        return int(float(brightness) / 65535.0 * 100)
+        return int(brightness * 100 / 65535.0)
+
+    def get_sensor_brightness(self, sensor_id):
+        self._request_states()
+        return self._brightness_to_percentage(self._sensor_states.get(sensor_id, {}).get('BRIGHTNESS'))
 
     def get_sensors_brightness(self):
-        amount_sensor_modules = self._master_communicator.do_command(CoreAPI.general_configuration_number_of_modules(), {})['sensor']
-        brightnesses = []
-        for sensor_id in range(amount_sensor_modules * 8):
-            brightnesses.append(self.get_sensor_brightness(sensor_id))
-        return brightnesses
+        to_percentage = self._brightness_to_percentage
+        return [to_percentage(brightness) for brightness in self._get_sensor_values('BRIGHTNESS')]
 
     def load_sensor(self, sensor_id):  # type: (int) -> SensorDTO
         sensor = SensorConfiguration(sensor_id)
         return SensorMapper.orm_to_dto(sensor)
 
     def load_sensors(self):  # type: () -> List[SensorDTO]
+        sensor_ids = self._enumerate_io_modules('sensor')
+        SensorConfiguration.preload(sensor_ids)
         sensors = []
-        for i in self._enumerate_io_modules('sensor'):
+        for i in sensor_ids:
             sensors.append(self.load_sensor(i))
         return sensors
 
     def save_sensors(self, sensors):  # type: (List[Tuple[SensorDTO, List[str]]]) -> None
         for sensor_dto, fields in sensors:
             sensor = SensorMapper.dto_to_orm(sensor_dto, fields)
-            sensor.save()  # TODO: Batch saving - postpone eeprom activate if relevant for the Core
+            sensor.save(activate=False)
+        MemoryActivator.activate()
 
     def _refresh_sensor_states(self):
-        amount_sensor_modules = self._master_communicator.do_command(CoreAPI.general_configuration_number_of_modules(), {})['sensor']
+        amount_sensor_modules = self._get_module_counts()['sensor']
         for module_nr in range(amount_sensor_modules):
-            temperature_values = self._master_communicator.do_command(CoreAPI.sensor_temperature_values(), {'module_nr': module_nr})['values']
-            brightness_values = self._master_communicator.do_command(CoreAPI.sensor_brightness_values(), {'module_nr': module_nr})['values']
-            humidity_values = self._master_communicator.do_command(CoreAPI.sensor_humidity_values(), {'module_nr': module_nr})['values']
+            fields = {'module_nr': module_nr}
+            temperature_values, brightness_values, humidity_values = [
+                result['values'] for result in self._master_communicator.do_commands([(CoreAPI.sensor_temperature_values(), fields),
+                                                                                       (CoreAPI.sensor_brightness_values(), fields),
+                                                                                       (CoreAPI.sensor_humidity_values(), fields)])
+            ]
             for i in range(8):
                 sensor_id = module_nr * 8 + i
                 self._sensor_states[sensor_id] = {'TEMPERATURE': temperature_values[i],
@@ -705,11 +836,25 @@ class MasterCoreController(MasterController):
             gpio_file.close()
 
         power(False)
-        time.sleep(5)
+        time.sleep(5)  # The power-off period is a hardware requirement
         power(True)
+        if not self._wait_for_master(timeout=5):
+            logger.warning('Master did not respond within 5 seconds after the cold reset')
 
         return {'status': 'OK'}
 
+    def _wait_for_master(self, timeout):
+        # type: (float) -> bool
+        """ Polls the master until it responds again, for at most `timeout` seconds """
+        end = time.time() + timeout
+        while time.time() < end:
+            try:
+                self._master_communicator.do_command(CoreAPI.get_firmware_version(), {}, timeout=1)
+                return True
+            except (CommunicationTimedOutException, InMaintenanceModeException):
+                time.sleep(0.1)
+        return False
+
     def get_modules(self):
         # TODO: implement
         return {'outputs': [], 'inputs': [], 'shutters': [], 'can_inputs': []}
@@ -735,13 +880,14 @@ class MasterCoreController(MasterController):
             if len(page_data) < page_length:
                 page_data += [255] * (page_length - len(page_data))
             data_structure[page] = page_data
-        self._restore(data_structure)
+        # Don't block on the activation, the Core notifies through an EEPROM_ACTIVATE event when done
+        self._restore(data_structure, activate_timeout=None)
 
     def factory_reset(self):
         pages, page_length = MemoryFile.SIZES[MemoryTypes.EEPROM]
         self._restore({page: [255] * page_length for page in range(pages)})
 
-    def _restore(self, data):  # type: (Dict[int, List[int]]) -> None
+    def _restore(self, data, activate_timeout=MemoryFile.ACTIVATE_TIMEOUT):  # type: (Dict[int, List[int]], Optional[int]) -> None
         pages, page_length = MemoryFile.SIZES[MemoryTypes.EEPROM]
         page_retry = None
         page = 0
@@ -754,7 +900,7 @@ class MasterCoreController(MasterController):
                     raise
                 page_retry = page
                 time.sleep(10)
-        self._memory_files[MemoryTypes.EEPROM].activate()
+        self._memory_files[MemoryTypes.EEPROM].activate(timeout=activate_timeout)
 
     def error_list(self):
         return []  # TODO: Implement
@@ -782,52 +928,131 @@ class MasterCoreController(MasterController):
 
 
 class MasterInputState(object):
+    """
+    Keeps track of the input statuses, based on input events and periodic refreshes.
+
+    The statuses are also kept packed per 8 inputs, in the layout the master reports
+    them, so a refresh can compare whole blocks and only has to look at the (rare)
+    inputs that actually changed. The per-input values are only touched for those.
+    """
+
     def __init__(self, interval=300):
         # type: (int) -> None
         self._interval = interval
         self._last_updated = 0  # type: float
-        self._values = {}  # type: Dict[int,MasterInputValue]
+        self._values = []  # type: List[Optional[MasterInputValue]]  # Indexed by input id
+        self._status = bytearray()  # Statuses of the refreshed inputs, packed per 8 like the master reports them
+        self._recent = deque(maxlen=64)  # type: deque  # (changed_at, input_id) of the latest changes
 
     def get_inputs(self):
         # type: () -> List[Dict[str,Any]]
-        return [x.serialize() for x in self._values.values()]
+        return [x.serialize() for x in self._values if x is not None]
 
     def get_recent(self):
         # type: () -> List[int]
-        sorted_inputs = sorted(list(self._values.values()), key=lambda x: x.changed_at)
-        recent_events = [x.input_id for x in sorted_inputs
-                         if x.changed_at > time.time() - 10]
-        return recent_events[-5:]
+        threshold = time.time() - 10
+        recent_inputs = []  # type: List[int]
+        for changed_at, input_id in reversed(list(self._recent)):
+            if changed_at <= threshold or len(recent_inputs) == 5:
+                break
+            if input_id not in recent_inputs:
+                recent_inputs.append(input_id)
+        recent_inputs.reverse()
+        return recent_inputs
 
     def handle_event(self, core_event):
         # type: (MasterCoreEvent) -> MasterEvent
-        value = MasterInputValue.from_core_event(core_event)
-        if value.input_id not in self._values:
-            self._values[value.input_id] = value
-        self._values[value.input_id].update(value)
+        data = core_event.data
+        input_id = data['input']
+        self._reserve_values(input_id + 1)
+        value = self._values[input_id]
+        if value is None:
+            value = MasterInputValue.from_core_event(core_event)
+            self._values[input_id] = value
+            self._recent.append((value.changed_at, value.input_id))
+        elif value.update_status(1 if data['status'] else 0):
+            # Only an actual change needs a new timestamp
+            self._recent.append((value.changed_at, value.input_id))
+            self._update_packed_status(value)
         return value.master_event()
 
-    def should_refresh(self):
-        # type: () -> bool
-        return self._last_updated + self._interval < time.time()
+    def _reserve_values(self, amount):
+        # type: (int) -> None
+        missing = amount - len(self._values)
+        if missing > 0:
+            self._values.extend([None] * missing)
+
+    def _update_packed_status(self, value):
+        # type: (MasterInputValue) -> None
+        byte_index, bit = divmod(value.input_id, 8)
+        if byte_index < len(self._status):
+            if value.status:
+                self._status[byte_index] |= 1 << bit
+            else:
+                self._status[byte_index] &= ~(1 << bit) & 0xFF
+
+    def should_refresh(self, now=None):
+        # type: (Optional[float]) -> bool
+        return self.next_refresh() < (time.time() if now is None else now)
+
+    def next_refresh(self):
+        # type: () -> float
+        return self._last_updated + self._interval
 
     def refresh(self, info):
         # type: (List[int]) -> List[MasterEvent]
         events = []
-        for i, byte in enumerate(info):
-            for j in range(0, 8):
-                current_status = byte >> j & 0x1
-                input_id = (i * 8) + j
-                if input_id not in self._values:
-                    self._values[input_id] = MasterInputValue(input_id, current_status)
-                state = self._values[input_id]
-                if state.update_status(current_status):
-                    events.append(state.master_event())
-        self._last_updated = time.time()
+        now = time.time()
+        info = bytearray(info)
+        self._reserve_values(len(info) * 8)
+        values = self._values
+        add_recent = self._recent.append
+        for input_id, current_status in _diff_packed_status(info, self._status):
+            state = values[input_id]
+            if state is None:
+                values[input_id] = MasterInputValue(input_id, current_status)
+            elif state.update_status(current_status, now=now):
+                add_recent((now, input_id))
+                events.append(state.master_event())
+        self._last_updated = now
         return events
 
 
+def _diff_packed_status(info, packed_status):
+    # type: (bytearray, bytearray) -> List[Tuple[int, int]]
+    """
+    Updates the packed statuses with the given information and returns the (input_id, status)
+    pairs of the inputs that changed. All inputs of bytes that weren't known yet are returned.
+    """
+    changes = []  # type: List[Tuple[int, int]]
+    if info == packed_status:
+        return changes  # Nothing changed, the steady state
+    add_change = changes.append
+    info_length = len(info)
+    for block_start in range(0, info_length, 8):
+        block_end = block_start + 8
+        if info[block_start:block_end] == packed_status[block_start:block_end]:
+            continue  # None of these 64 inputs changed
+        for i in range(block_start, min(block_end, info_length)):
+            byte = info[i]
+            if i < len(packed_status):
+                changed_bits = byte ^ packed_status[i]
+                if not changed_bits:
+                    continue  # None of these 8 inputs changed
+                packed_status[i] = byte
+            else:
+                changed_bits = 0xFF  # First refresh of these inputs, check them all
+                packed_status.append(byte)
+            current_bits = _BYTE_BITS[byte]
+            for j in _SET_BITS[changed_bits]:
+                add_change(((i * 8) + j, current_bits[j]))
+    return changes
+
+
 class MasterInputValue(object):
+    __slots__ = ['input_id', 'status', 'changed_at']
+    _BOOL = (False, True)
+
     def __init__(self, input_id, status, changed_at=0):
         # type: (int, int, float) -> None
         self.input_id = input_id
@@ -837,9 +1062,10 @@ class MasterInputValue(object):
     @classmethod
     def from_core_event(cls, event):
         # type: (MasterCoreEvent) -> MasterInputValue
-        status = 1 if event.data['status'] else 0
+        data = event.data  # Built on every access
+        status = 1 if data['status'] else 0
         changed_at = time.time()
-        return cls(event.data['input'], status, changed_at=changed_at)
+        return cls(data['input'], status, changed_at=changed_at)
 
     def serialize(self):
         # type: () -> Dict[str,Any]
@@ -849,20 +1075,20 @@ class MasterInputValue(object):
         # type: (MasterInputValue) -> None
         self.update_status(other_value.status)
 
-    def update_status(self, current_status):
-        # type: (int) -> bool
+    def update_status(self, current_status, now=None):
+        # type: (int, Optional[float]) -> bool
         is_changed = self.status != current_status
         if is_changed:
             self.status = current_status
-            self.changed_at = time.time()
+            self.changed_at = time.time() if now is None else now
         return is_changed
 
     def master_event(self):
         # type: () -> MasterEvent
         return MasterEvent(event_type=MasterEvent.Types.INPUT_CHANGE,
                            data={'id': self.input_id,
-                                 'status': bool(self.status),
-                                 'location': {'room_id': 255}})  # TODO: missing room
+                                 'status': MasterInputValue._BOOL[self.status],
+                                 'location': _DEFAULT_LOCATION})
 
     def __repr__(self):
         # type: () -> str
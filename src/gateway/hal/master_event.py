@@ -46,6 +46,8 @@ class MasterEvent(object):
         SHUTTER_CHANGE = 'SHUTTER_CHANGE'
         MODULE_DISCOVERY = 'MODULE_DISCOVERY'
 
+    __slots__ = ['type', 'data']
+
     def __init__(self, event_type, data):
         self.type = event_type
         self.data = data
@@ -39,12 +39,18 @@ class InputController(BaseController):
         super(InputController, self).__init__(master_controller)
 
     def load_input(self, input_id):  # type: (int) -> InputDTO
+        input_dto = self._get_cached('inputs', input_id)
+        if input_dto is not None:
+            return input_dto
         input_ = Input.get(number=input_id)  # type: Input
         input_dto = self._master_controller.load_input(input_id=input_.number)
         input_dto.room = input_.room.number if input_.room is not None else None
         return input_dto
 
     def load_inputs(self):  # type: () -> List[InputDTO]
+        return self._load_cached('inputs', self._load_inputs)
+
+    def _load_inputs(self):  # type: () -> List[InputDTO]
         inputs_dtos = []
         for input_ in Input.select():
             input_dto = self._master_controller.load_input(input_id=input_.number)
@@ -53,17 +59,19 @@ class InputController(BaseController):
         return inputs_dtos
 
     def save_inputs(self, inputs):  # type: (List[Tuple[InputDTO, List[str]]]) -> None
-        inputs_to_save = []
-        for input_dto, fields in inputs:
-            input_ = Input.get_or_none(number=input_dto.id)  # type: Input
-            if input_ is None:
-                logger.info('Ignored saving non-existing Input {0}'.format(input_dto.id))
-            if 'room' in fields:
-                if input_dto.room is None:
-                    input_.room = None
-                elif 0 <= input_dto.room <= 100:
-                    # TODO: Validation should happen on API layer
-                    input_.room, _ = Room.get_or_create(number=input_dto.room)
-                input_.save()
-            inputs_to_save.append((input_dto, fields))
-        self._master_controller.save_inputs(inputs_to_save)
+        with BaseController.invalidating_caches():
+            inputs_to_save = []
+            with Input._meta.database.atomic():  # A single transaction for all rows
+                for input_dto, fields in inputs:
+                    input_ = Input.get_or_none(number=input_dto.id)  # type: Input
+                    if input_ is None:
+                        logger.info('Ignored saving non-existing Input {0}'.format(input_dto.id))
+                    if 'room' in fields:
+                        if input_dto.room is None:
+                            input_.room = None
+                        elif 0 <= input_dto.room <= 100:
+                            # TODO: Validation should happen on API layer
+                            input_.room, _ = Room.get_or_create(number=input_dto.room)
+                        input_.save()
+                    inputs_to_save.append((input_dto, fields))
+            self._master_controller.save_inputs(inputs_to_save)
@@ -39,12 +39,18 @@ class OutputController(BaseController):
         super(OutputController, self).__init__(master_controller)
 
     def load_output(self, output_id):  # type: (int) -> OutputDTO
+        output_dto = self._get_cached('outputs', output_id)
+        if output_dto is not None:
+            return output_dto
         output = Output.get(number=output_id)  # type: Output
         output_dto = self._master_controller.load_output(output_id=output.number)
         output_dto.room = output.room.number if output.room is not None else None
         return output_dto
 
     def load_outputs(self):  # type: () -> List[OutputDTO]
+        return self._load_cached('outputs', self._load_outputs)
+
+    def _load_outputs(self):  # type: () -> List[OutputDTO]
         outputs_dtos = []
         for output in Output.select():
             output_dto = self._master_controller.load_output(output_id=output.number)
@@ -53,16 +59,18 @@ class OutputController(BaseController):
         return outputs_dtos
 
     def save_outputs(self, outputs):  # type: (List[Tuple[OutputDTO, List[str]]]) -> None
-        outputs_to_save = []
-        for output_dto, fields in outputs:
-            output = Output.get_or_none(number=output_dto.id)  # type: Output
-            if output is None:
-                logger.info('Ignored saving non-existing Output {0}'.format(output_dto.id))
-            if 'room' in fields:
-                if output_dto.room is None:
-                    output.room = None
-                elif 0 <= output_dto.room <= 100:
-                    output.room, _ = Room.get_or_create(number=output_dto.room)
-                output.save()
-            outputs_to_save.append((output_dto, fields))
-        self._master_controller.save_outputs(outputs_to_save)
+        with BaseController.invalidating_caches():
+            outputs_to_save = []
+            with Output._meta.database.atomic():  # A single transaction for all rows
+                for output_dto, fields in outputs:
+                    output = Output.get_or_none(number=output_dto.id)  # type: Output
+                    if output is None:
+                        logger.info('Ignored saving non-existing Output {0}'.format(output_dto.id))
+                    if 'room' in fields:
+                        if output_dto.room is None:
+                            output.room = None
+                        elif 0 <= output_dto.room <= 100:
+                            output.room, _ = Room.get_or_create(number=output_dto.room)
+                        output.save()
+                    outputs_to_save.append((output_dto, fields))
+            self._master_controller.save_outputs(outputs_to_save)
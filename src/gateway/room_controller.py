@@ -17,13 +17,15 @@ Room BLL
 """
 from __future__ import absolute_import
 import logging
+from peewee import JOIN
 from ioc import Injectable, Singleton
+from gateway.base_controller import BaseController
 from gateway.dto import RoomDTO
-from gateway.models import Room
+from gateway.models import Floor, Room
 from gateway.mappers import RoomMapper, FloorMapper
 
 if False:  # MYPY
-    from typing import List, Tuple
+    from typing import List, Optional, Tuple
 
 logger = logging.getLogger("openmotics")
 
@@ -36,8 +38,16 @@ class RoomController(object):
         pass
 
     def load_room(self, room_id):  # type: (int) -> RoomDTO
+        room_dto = self.load_room_or_none(room_id)
+        if room_dto is None:
+            raise Room.DoesNotExist('Room {0} does not exist'.format(room_id))
+        return room_dto
+
+    def load_room_or_none(self, room_id):  # type: (int) -> Optional[RoomDTO]
         _ = self
-        room = Room.get(number=room_id)
+        room = Room.select(Room, Floor).join(Floor, JOIN.LEFT_OUTER).where(Room.number == room_id).first()
+        if room is None:
+            return None
         room_dto = RoomMapper.orm_to_dto(room)
         if room.floor is not None:
             room_dto.floor = FloorMapper.orm_to_dto(room.floor)
@@ -46,7 +56,7 @@ class RoomController(object):
     def load_rooms(self):  # type: () -> List[RoomDTO]
         _ = self
         room_dtos = []
-        for room in Room.select():
+        for room in Room.select(Room, Floor).join(Floor, JOIN.LEFT_OUTER):  # Loads the floors in the same query
             room_dto = RoomMapper.orm_to_dto(room)
             if room.floor is not None:
                 room_dto.floor = FloorMapper.orm_to_dto(room.floor)
@@ -55,15 +65,17 @@ class RoomController(object):
 
     def save_rooms(self, rooms):  # type: (List[Tuple[RoomDTO, List[str]]]) -> None
         _ = self
-        for room_dto, fields in rooms:
-            if room_dto.in_use:
-                room = RoomMapper.dto_to_orm(room_dto, fields)
-                if 'floor' in fields:
-                    floor = None
-                    if room_dto.floor is not None:
-                        floor = FloorMapper.dto_to_orm(room_dto.floor, ['id'])
-                        floor.save()
-                    room.floor = floor
-                room.save()
-            else:
-                Room.delete().where(number=room_dto.id).execute()
+        with BaseController.invalidating_caches():  # Removed rooms are unlinked from e.g. outputs
+            with Room._meta.database.atomic():  # A single transaction for all rows
+                for room_dto, fields in rooms:
+                    if room_dto.in_use:
+                        room = RoomMapper.dto_to_orm(room_dto, fields)
+                        if 'floor' in fields:
+                            floor = None
+                            if room_dto.floor is not None:
+                                floor = FloorMapper.dto_to_orm(room_dto.floor, ['id'])
+                                floor.save()
+                            room.floor = floor
+                        room.save()
+                    else:
+                        Room.delete().where(number=room_dto.id).execute()
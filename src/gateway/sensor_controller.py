@@ -39,12 +39,18 @@ class SensorController(BaseController):
         super(SensorController, self).__init__(master_controller)
 
     def load_sensor(self, sensor_id):  # type: (int) -> SensorDTO
+        sensor_dto = self._get_cached('sensors', sensor_id)
+        if sensor_dto is not None:
+            return sensor_dto
         sensor = Sensor.get(number=sensor_id)  # type: Sensor
         sensor_dto = self._master_controller.load_sensor(sensor_id=sensor.number)
         sensor_dto.room = sensor.room.number if sensor.room is not None else None
         return sensor_dto
 
     def load_sensors(self):  # type: () -> List[SensorDTO]
+        return self._load_cached('sensors', self._load_sensors)
+
+    def _load_sensors(self):  # type: () -> List[SensorDTO]
         sensor_dtos = []
         for sensor_ in Sensor.select():
             sensor_dto = self._master_controller.load_sensor(sensor_id=sensor_.number)
@@ -53,16 +59,18 @@ class SensorController(BaseController):
         return sensor_dtos
 
     def save_sensors(self, sensors):  # type: (List[Tuple[SensorDTO, List[str]]]) -> None
-        sensors_to_save = []
-        for sensor_dto, fields in sensors:
-            sensor_ = Sensor.get_or_none(number=sensor_dto.id)  # type: Sensor
-            if sensor_ is None:
-                logger.info('Ignored saving non-existing Sensor {0}'.format(sensor_dto.id))
-            if 'room' in fields:
-                if sensor_dto.room is None:
-                    sensor_.room = None
-                elif 0 <= sensor_dto.room <= 100:
-                    sensor_.room, _ = Room.get_or_create(number=sensor_dto.room)
-                sensor_.save()
-            sensors_to_save.append((sensor_dto, fields))
-        self._master_controller.save_sensors(sensors_to_save)
+        with BaseController.invalidating_caches():
+            sensors_to_save = []
+            with Sensor._meta.database.atomic():  # A single transaction for all rows
+                for sensor_dto, fields in sensors:
+                    sensor_ = Sensor.get_or_none(number=sensor_dto.id)  # type: Sensor
+                    if sensor_ is None:
+                        logger.info('Ignored saving non-existing Sensor {0}'.format(sensor_dto.id))
+                    if 'room' in fields:
+                        if sensor_dto.room is None:
+                            sensor_.room = None
+                        elif 0 <= sensor_dto.room <= 100:
+                            sensor_.room, _ = Room.get_or_create(number=sensor_dto.room)
+                        sensor_.save()
+                    sensors_to_save.append((sensor_dto, fields))
+            self._master_controller.save_sensors(sensors_to_save)
@@ -142,12 +142,18 @@ class ShutterController(BaseController):
     # Configure shutters
 
     def load_shutter(self, shutter_id):  # type: (int) -> ShutterDTO
+        shutter_dto = self._get_cached('shutters', shutter_id)
+        if shutter_dto is not None:
+            return shutter_dto
         shutter = Shutter.get(number=shutter_id)  # type: Shutter
         shutter_dto = self._master_controller.load_shutter(shutter_id=shutter.number)
         shutter_dto.room = shutter.room.number if shutter.room is not None else None
         return shutter_dto
 
     def load_shutters(self):  # type: () -> List[ShutterDTO]
+        return self._load_cached('shutters', self._load_shutters)
+
+    def _load_shutters(self):  # type: () -> List[ShutterDTO]
         shutter_dtos = []
         for shutter in Shutter.select():
             shutter_dto = self._master_controller.load_shutter(shutter_id=shutter.number)
@@ -156,28 +162,36 @@ class ShutterController(BaseController):
         return shutter_dtos
 
     def save_shutters(self, shutters):  # type: (List[Tuple[ShutterDTO, List[str]]]) -> None
-        shutters_to_save = []
-        for shutter_dto, fields in shutters:
-            shutter = Shutter.get_or_none(number=shutter_dto.id)  # type: Shutter
-            if shutter is None:
-                logger.info('Ignored saving non-existing Shutter {0}'.format(shutter_dto.id))
-            if 'room' in fields:
-                if shutter_dto.room is None:
-                    shutter.room = None
-                elif 0 <= shutter_dto.room <= 100:
-                    shutter.room, _ = Room.get_or_create(number=shutter_dto.room)
-                shutter.save()
-            shutters_to_save.append((shutter_dto, fields))
-        self._master_controller.save_shutters(shutters_to_save)
+        with BaseController.invalidating_caches():
+            shutters_to_save = []
+            with Shutter._meta.database.atomic():  # A single transaction for all rows
+                for shutter_dto, fields in shutters:
+                    shutter = Shutter.get_or_none(number=shutter_dto.id)  # type: Shutter
+                    if shutter is None:
+                        logger.info('Ignored saving non-existing Shutter {0}'.format(shutter_dto.id))
+                    if 'room' in fields:
+                        if shutter_dto.room is None:
+                            shutter.room = None
+                        elif 0 <= shutter_dto.room <= 100:
+                            shutter.room, _ = Room.get_or_create(number=shutter_dto.room)
+                        shutter.save()
+                    shutters_to_save.append((shutter_dto, fields))
+            self._master_controller.save_shutters(shutters_to_save)
         self.update_config(self.load_shutters())
 
     def load_shutter_group(self, group_id):  # type: (int) -> ShutterGroupDTO
+        shutter_group_dto = self._get_cached('shutter_groups', group_id)
+        if shutter_group_dto is not None:
+            return shutter_group_dto
         shutter_group = ShutterGroup.get(number=group_id)  # type: ShutterGroup
         shutter_group_dto = self._master_controller.load_shutter_group(shutter_group_id=shutter_group.number)
         shutter_group_dto.room = shutter_group.room.number if shutter_group.room is not None else None
         return shutter_group_dto
 
     def load_shutter_groups(self):  # type: () -> List[ShutterGroupDTO]
+        return self._load_cached('shutter_groups', self._load_shutter_groups)
+
+    def _load_shutter_groups(self):  # type: () -> List[ShutterGroupDTO]
         shutter_group_dtos = []
         for shutter_group in ShutterGroup.select():
             shutter_group_dto = self._master_controller.load_shutter_group(shutter_group_id=shutter_group.number)
@@ -186,19 +200,21 @@ class ShutterController(BaseController):
         return shutter_group_dtos
 
     def save_shutter_groups(self, shutter_groups):  # type: (List[Tuple[ShutterGroupDTO, List[str]]]) -> None
-        shutter_groups_to_save = []
-        for shutter_group_dto, fields in shutter_groups:
-            shutter_group = ShutterGroup.get_or_none(number=shutter_group_dto.id)  # type: ShutterGroup
-            if shutter_group is None:
-                continue
-            if 'room' in fields:
-                if shutter_group_dto.room is None:
-                    shutter_group.room = None
-                elif 0 <= shutter_group_dto.room <= 100:
-                    shutter_group.room, _ = Room.get_or_create(number=shutter_group_dto.room)
-                shutter_group.save()
-            shutter_groups_to_save.append((shutter_group_dto, fields))
-        self._master_controller.save_shutter_groups(shutter_groups_to_save)
+        with BaseController.invalidating_caches():
+            shutter_groups_to_save = []
+            with ShutterGroup._meta.database.atomic():  # A single transaction for all rows
+                for shutter_group_dto, fields in shutter_groups:
+                    shutter_group = ShutterGroup.get_or_none(number=shutter_group_dto.id)  # type: ShutterGroup
+                    if shutter_group is None:
+                        continue
+                    if 'room' in fields:
+                        if shutter_group_dto.room is None:
+                            shutter_group.room = None
+                        elif 0 <= shutter_group_dto.room <= 100:
+                            shutter_group.room, _ = Room.get_or_create(number=shutter_group_dto.room)
+                        shutter_group.save()
+                    shutter_groups_to_save.append((shutter_group_dto, fields))
+            self._master_controller.save_shutter_groups(shutter_groups_to_save)
 
     # Control shutters
 
@@ -205,10 +205,10 @@ class UserController(object):
 
     def check_token(self, token):
         """ Returns True if the token is valid, False if the token is invalid. """
-        if token is None or token not in self._tokens:
+        token_info = self._tokens.get(token) if token is not None else None
+        if token_info is None:
             return False
-        else:
-            return self._tokens[token][1] >= time.time()
+        return token_info[1] >= time.time()
 
     def close(self):
         """ Cose the database connection. """
@@ -21,6 +21,7 @@ import logging
 import os
 import subprocess
 import sys
+import threading
 import time
 import uuid
 
@@ -53,7 +54,7 @@ from serial_utils import CommunicationTimedOutException
 import six
 
 if False:
-    from typing import Dict, Optional, Any, List
+    from typing import Dict, Optional, Any, List, Tuple
     from bus.om_bus_client import MessageClient
     from gateway.config import ConfigurationController
     from gateway.gateway_api import GatewayApi
@@ -76,32 +77,10 @@ if False:
 logger = logging.getLogger("openmotics")
 
 
-class FloatWrapper(float):
-    """ Wrapper for float value that limits the number of digits when printed. """
-
-    def __repr__(self):
-        return '%.2f' % self
-
-
 class BadRequestException(Exception):
     pass
 
 
-def limit_floats(struct):
-    """
-    Usage: json.dumps(limit_floats(struct)). This limits the number of digits in the json string.
-    :param struct: Structure of which floats will be shortended
-    """
-    if isinstance(struct, (list, tuple)):
-        return [limit_floats(element) for element in struct]
-    elif isinstance(struct, dict):
-        return dict((key, limit_floats(value)) for key, value in struct.items())
-    elif isinstance(struct, float):
-        return FloatWrapper(struct)
-    else:
-        return struct
-
-
 def error_generic(status, message, *args, **kwargs):
     _ = args, kwargs
     cherrypy.response.headers["Content-Type"] = "application/json"
@@ -121,33 +100,67 @@ cherrypy.config.update({'error_page.404': error_generic,
                         'request.error_response': error_unexpected})
 
 
-def params_parser(params, param_types):
-    for key in set(params).intersection(set(param_types)):
+_NONE_VALUES = frozenset(['null', 'none', ''])
+_FALSE_VALUES = frozenset(['false', '0', '0.0', 'no'])
+
+
+def _to_bool(value):
+    return str(value).lower() not in _FALSE_VALUES
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except ValueError:
+        # Double convertion. Params come in as strings, and int('0.0') fails, while int(float('0.0')) works as expected
+        return int(float(value))
+
+
+def _param_converter(param_type):
+    if isinstance(param_type, list):
+        def _check_value(value):
+            if value not in param_type:
+                raise ValueError('Value has invalid value')
+            return value
+        return _check_value
+    if param_type == bool:
+        return _to_bool
+    if param_type == 'json':
+        return json.loads
+    if param_type == int:
+        return _to_int
+    return param_type
+
+
+def compile_param_types(param_types):
+    """ Builds the (key, converter) pairs for the given param types, once instead of on every request """
+    return tuple((key, _param_converter(param_type)) for key, param_type in param_types.items())
+
+
+def parse_params(params, converters):
+    for key, converter in converters:
+        if key not in params:
+            continue
         value = params[key]
         if value is None:
             continue
-        if isinstance(value, six.string_types) and value.lower() in ['null', 'none', '']:
+        if isinstance(value, six.string_types) and value.lower() in _NONE_VALUES:
             params[key] = None
         else:
-            if isinstance(param_types[key], list):
-                if value not in param_types[key]:
-                    raise ValueError('Value has invalid value')
-            elif param_types[key] == bool:
-                params[key] = str(value).lower() not in ['false', '0', '0.0', 'no']
-            elif param_types[key] == 'json':
-                params[key] = json.loads(value)
-            elif param_types[key] == int:
-                # Double convertion. Params come in as strings, and int('0.0') fails, while int(float('0.0')) works as expected
-                params[key] = int(float(value))
-            else:
-                params[key] = param_types[key](value)
-
-
-def params_handler(**kwargs):
+            params[key] = converter(value)
+
+
+def params_parser(params, param_types):
+    parse_params(params, compile_param_types(param_types))
+
+
+def params_handler(converters):
     """ Convert specified request params. """
     request = cherrypy.request
+    if request.handler is None:
+        return  # Already answered by an earlier tool (e.g. cors preflight or authentication)
     try:
-        params_parser(request.params, kwargs)
+        parse_params(request.params, converters)
     except ValueError:
         cherrypy.response.headers['Content-Type'] = 'application/json'
         cherrypy.response.status = 406  # No Acceptable
@@ -158,6 +171,8 @@ def params_handler(**kwargs):
 
 def timestamp_handler():
     request = cherrypy.request
+    if request.handler is None:
+        return
     if 'fe_time' in request.params:
         del request.params["fe_time"]
 
@@ -180,21 +195,20 @@ def authentication_handler(pass_token=False):
             token = request.params.pop('token')
         if token is None:
             header = request.headers.get('Authorization')
-            if header is not None and 'Bearer ' in header:
-                token = header.replace('Bearer ', '')
+            if header is not None and header.startswith('Bearer '):
+                token = header[7:]
         if token is None:
             header = request.headers.get('Sec-WebSocket-Protocol')
-            if header is not None and 'authorization.bearer.' in header:
-                unpadded_base64_token = header.replace('authorization.bearer.', '')
-                base64_token = unpadded_base64_token + '=' * (-len(unpadded_base64_token) % 4)
+            if header is not None and header.startswith('authorization.bearer.'):
+                unpadded_base64_token = header[21:]
                 try:
-                    token = base64.decodestring(base64_token).decode('utf-8')
+                    # Surplus padding is ignored by the decoder
+                    token = base64.b64decode(unpadded_base64_token + '===').decode('utf-8')
                 except Exception:
                     pass
         _self = request.handler.callable.__self__
         if request.remote.ip != '127.0.0.1':
-            check_token = _self._user_controller.check_token if hasattr(_self, '_user_controller') else _self.webinterface.check_token
-            if not check_token(token):
+            if not _self._auth_check_token(token):
                 raise RuntimeError()
         if pass_token is True:
             request.params['token'] = token
@@ -207,18 +221,135 @@ def authentication_handler(pass_token=False):
 
 cherrypy.tools.timestamp_filter = cherrypy.Tool('before_handler', timestamp_handler)
 cherrypy.tools.cors = cherrypy.Tool('before_handler', cors_handler, priority=10)
-cherrypy.tools.authenticated = cherrypy.Tool('before_handler', authentication_handler)
+cherrypy.tools.authenticated = cherrypy.Tool('before_handler', authentication_handler, priority=20)
 cherrypy.tools.params = cherrypy.Tool('before_handler', params_handler)
 
 
+_MSGPACK_MEDIA_TYPES = frozenset(['application/msgpack', 'application/x-msgpack'])
+
+
+def _accepts_msgpack(accept):
+    """ Returns whether the client explicitly asked for a (more compact) MessagePack response """
+    if accept is None or 'msgpack' not in accept:
+        return False
+    for media_range in accept.split(','):
+        parameters = media_range.split(';')
+        if parameters[0].strip().lower() not in _MSGPACK_MEDIA_TYPES:
+            continue
+        quality = 1.0
+        for parameter in parameters[1:]:
+            name, _, value = parameter.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            return True
+    return False
+
+
+def _check_fields(fields, serializer):  # type: (Optional[List[str]], Any) -> None
+    """ Rejects requested fields that the serializer doesn't provide """
+    if fields is not None:
+        for field in fields:
+            if field not in serializer.FIELDS:
+                raise cherrypy.HTTPError(400, 'Unknown field: {0}'.format(field))
+
+
+class ResponseCache(object):
+    """
+    Keeps the serialized responses of cached API calls for a short while, so clients that
+    are polling e.g. the configurations don't reload and serialize them over and over again.
+    Concurrent misses for the same response wait for the first one instead of loading it as well.
+    """
+
+    POLICIES = {'short': 1.0,  # Seconds, for statuses
+                'normal': 5.0}  # Seconds, for configurations
+    LOAD_TIMEOUT = 10.0  # Seconds to wait for a concurrent load, before loading anyway
+
+    def __init__(self):  # type: () -> None
+        self._entries = {}  # type: Dict[Tuple[Any, ...], Tuple[float, Tuple[str, Any]]]
+        self._loading = {}  # type: Dict[Tuple[Any, ...], Tuple[float, threading.Event]]
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.stats = {'hits': {},
+                      'misses': {},
+                      'stale_served': {}}  # type: Dict[str, Dict[str, int]]
+
+    def count(self, kind, name):  # type: (str, str) -> None
+        counters = self.stats[kind]
+        counters[name] = counters.get(name, 0) + 1
+
+    def get(self, key, now):  # type: (Tuple[Any, ...], float) -> Tuple[Optional[Tuple[str, Any]], Optional[threading.Event]]
+        """
+        Returns the cached response and None, or None and a token if the caller has to load the
+        response. The token has to be passed to `store`, even if the response couldn't be loaded.
+        """
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.count('hits', key[0])
+                return entry[1], None
+            with self._lock:
+                entry = self._entries.get(key)  # Might have been stored in the meantime
+                if entry is None or entry[0] <= now:
+                    loading = self._loading.get(key)
+                    if loading is None or loading[0] <= now:  # Nobody is loading it, or the load got stuck
+                        token = threading.Event()
+                        self._loading[key] = (now + ResponseCache.LOAD_TIMEOUT, token)
+                        self.count('misses', key[0])
+                        return None, token
+            if entry is None or entry[0] <= now:
+                if not loading[1].wait(loading[0] - now):
+                    now = loading[0]  # Gave up waiting, so the next iteration takes over the load
+                # Either there's a response now, or the load failed (or was cleared) and one of
+                # the waiting calls becomes the next loader
+
+    def store(self, key, token, generation, expire, response):
+        # type: (Tuple[Any, ...], threading.Event, int, float, Optional[Tuple[str, Any]]) -> None
+        """ Stores a loaded response, or only releases the waiting calls if it couldn't be loaded (None) """
+        if response is not None and generation == self.generation:  # Don't store responses that might predate a clear
+            self._entries[key] = (expire, response)
+        with self._lock:
+            loading = self._loading.get(key)
+            if loading is not None and loading[1] is token:  # Otherwise, another call took over the load
+                del self._loading[key]
+        token.set()
+
+    def clear(self):  # type: () -> None
+        self.generation += 1
+        self._entries = {}
+
+
+_response_cache = ResponseCache()
+# Most setters have nothing to return, so their (content type, contents) responses are serialized upfront
+_SUCCESS_RESPONSES = {False: ('application/json', json.dumps({'success': True})),
+                      True: ('application/msgpack', msgpack.dumps({'success': True}))}
+
+
 @decorator
 def _openmotics_api(f, *args, **kwargs):
     start = time.time()
-    timings = {}
+    accepts_msgpack = _accepts_msgpack(cherrypy.request.headers.get('Accept'))
+    cherrypy.response.headers['Vary'] = 'Accept'  # The same call returns JSON or MessagePack
+    if f._deprecated_header is not None:
+        cherrypy.response.headers['Warning'] = f._deprecated_header
+    cache_key = None
+    cache_token = None
+    if f.cache_ttl is not None:
+        fields = kwargs.get('fields', args[1] if len(args) > 1 else None)  # Cached calls only take the fields
+        cache_key = (f.__name__, accepts_msgpack, None if fields is None else tuple(fields))
+        response, cache_token = _response_cache.get(cache_key, start)
+        if response is not None:
+            cherrypy.response.headers['Content-Type'] = response[0]
+            cherrypy.response.status = 200  # OK
+            return response[1]
+    cache_generation = _response_cache.generation
     status = 200  # OK
     try:
-        return_data = f(*args, **kwargs)
-        data = limit_floats(dict(list({'success': True}.items()) + list(return_data.items())))
+        data = {'success': True}
+        data.update(f(*args, **kwargs))
     except cherrypy.HTTPError as ex:
         status = ex.status
         data = {'success': False, 'msg': ex._message}
@@ -237,27 +368,47 @@ def _openmotics_api(f, *args, **kwargs):
         logger.exception('Unexpected error during API call %s', f.__name__)
         status = 200  # OK
         data = {'success': False, 'msg': str(ex)}
-    timings['process'] = ('Processing', time.time() - start)
-    serialization_start = time.time()
-    contents = json.dumps(data)
-    timings['serialization'] = 'Serialization', time.time() - serialization_start
-    cherrypy.response.headers['Content-Type'] = 'application/json'
-    cherrypy.response.headers['Server-Timing'] = ','.join(['{0}={1}; "{2}"'.format(key, value[1] * 1000, value[0])
-                                                           for key, value in timings.items()])
-    if hasattr(f, 'deprecated') and f.deprecated is not None:
-        cherrypy.response.headers['Warning'] = 'Warning: 299 - "Deprecated, replaced by: {0}"'.format(f.deprecated)
-    cherrypy.response.status = status
+    response = None  # type: Optional[Tuple[str, Any]]
+    try:
+        serialization_start = time.time()
+        process_duration = serialization_start - start
+        if len(data) == 1 and data['success'] is True:  # Nothing but the success flag
+            content_type, contents = _SUCCESS_RESPONSES[accepts_msgpack]
+        elif accepts_msgpack:
+            contents = msgpack.dumps(data)
+            content_type = 'application/msgpack'
+        else:
+            contents = json.dumps(data)
+            content_type = 'application/json'
+        serialization_duration = time.time() - serialization_start
+        cherrypy.response.headers['Content-Type'] = content_type
+        cherrypy.response.headers['Server-Timing'] = 'process={0}; "Processing",serialization={1}; "Serialization"'.format(
+            process_duration * 1000, serialization_duration * 1000
+        )
+        cherrypy.response.status = status
+        if status == 200 and data['success'] is True and cherrypy.response.headers.get('X-Cache') != 'stale':
+            response = (content_type, contents)  # Stale fallback data isn't cached, so it's marked as such every time
+    finally:
+        if cache_token is not None:
+            # Always called, as it also releases concurrent calls waiting for this response
+            _response_cache.store(cache_key, cache_token, cache_generation, start + f.cache_ttl, response)
+    if cache_key is None and f.invalidates_cache:
+        _response_cache.clear()  # The call changed (or might have partially changed) cached data
     return contents
 
 
-def openmotics_api(auth=False, check=None, pass_token=False, plugin_exposed=True, deprecated=None):
+def openmotics_api(auth=False, check=None, pass_token=False, plugin_exposed=True, deprecated=None, cache=None,
+                   invalidates=False):
     def wrapper(func):
         func.deprecated = deprecated
+        func._deprecated_header = None if deprecated is None else 'Warning: 299 - "Deprecated, replaced by: {0}"'.format(deprecated)
+        func.cache_ttl = None if cache is None else ResponseCache.POLICIES[cache]
+        func.invalidates_cache = invalidates
         func = _openmotics_api(func)
         if auth is True:
             func = cherrypy.tools.authenticated(pass_token=pass_token)(func)
         if check is not None:
-            func = cherrypy.tools.params(**check)(func)
+            func = cherrypy.tools.params(converters=compile_param_types(check))(func)
         func.exposed = True
         func.plugin_exposed = plugin_exposed
         func.check = check
@@ -274,6 +425,13 @@ def types(**kwargs):
 class WebInterface(object):
     """ This class defines the web interface served by cherrypy. """
 
+    __slots__ = ['_user_controller', '_config_controller', '_scheduling_controller', '_thermostat_controller',
+                 '_shutter_controller', '_output_controller', '_room_controller', '_input_controller',
+                 '_sensor_controller', '_pulse_counter_controller', '_group_action_controller',
+                 '_frontpanel_controller', '_gateway_api', '_maintenance_controller', '_message_client',
+                 '_plugin_controller', '_metrics_collector', '_metrics_controller', '_ws_metrics_registered',
+                 '_power_dirty', '_service_state', '_last_known_data']
+
     @Inject
     def __init__(self, user_controller=INJECTED, gateway_api=INJECTED, maintenance_controller=INJECTED,
                  message_client=INJECTED, configuration_controller=INJECTED, scheduling_controller=INJECTED,
@@ -307,6 +465,25 @@ class WebInterface(object):
         self._ws_metrics_registered = False
         self._power_dirty = False
         self._service_state = False
+        self._last_known_data = {}  # type: Dict[str, Any]
+
+    def _auth_check_token(self, token):
+        """ Used by the authentication tool """
+        return self._user_controller.check_token(token)
+
+    def _load_with_fallback(self, key, load):
+        """ Loads data from the master, falling back to the last known data when the master doesn't respond """
+        try:
+            data = load()
+        except CommunicationTimedOutException:
+            data = self._last_known_data.get(key)
+            if data is None:
+                raise
+            cherrypy.response.headers['X-Cache'] = 'stale'
+            _response_cache.count('stale_served', key)
+            return data
+        self._last_known_data[key] = data
+        return data
 
     def in_authorized_mode(self):
         return self._frontpanel_controller.authorized_mode
@@ -320,17 +497,18 @@ class WebInterface(object):
             if not answers:
                 return
             receivers = answers.pop()
-            for client_id in receivers.keys():
-                receiver_info = receivers.get(client_id)
-                if receiver_info is None:
-                    continue
+            payload = msgpack.dumps(metric)  # The same for all receivers
+            metric_source, metric_type = metric['source'], metric['type']
+            get_filter = self._metrics_controller.get_filter  # Memoizes the filters per pattern
+            is_remote = cherrypy.request.remote.ip != '127.0.0.1'
+            for client_id, receiver_info in list(receivers.items()):
                 try:
-                    if cherrypy.request.remote.ip != '127.0.0.1' and not self._user_controller.check_token(receiver_info['token']):
+                    if metric_source not in get_filter('source', receiver_info['source']) or \
+                            metric_type not in get_filter('metric_type', receiver_info['metric_type']):
+                        continue
+                    if is_remote and not self._user_controller.check_token(receiver_info['token']):
                         raise cherrypy.HTTPError(401, 'invalid_token')
-                    sources = self._metrics_controller.get_filter('source', receiver_info['source'])
-                    metric_types = self._metrics_controller.get_filter('metric_type', receiver_info['metric_type'])
-                    if metric['source'] in sources and metric['type'] in metric_types:
-                        receiver_info['socket'].send(msgpack.dumps(metric), binary=True)
+                    receiver_info['socket'].send(payload, binary=True)
                 except cherrypy.HTTPError as ex:  # As might be caught from the `check_token` function
                     receiver_info['socket'].close(ex.code, ex.message)
                 except Exception as ex:
@@ -345,16 +523,15 @@ class WebInterface(object):
             if not answers:
                 return
             receivers = answers.pop()
-            for client_id in receivers.keys():
-                receiver_info = receivers.get(client_id)
-                if receiver_info is None:
-                    continue
+            payload = msgpack.dumps(event.serialize())  # The same for all receivers
+            is_remote = cherrypy.request.remote.ip != '127.0.0.1'
+            for client_id, receiver_info in list(receivers.items()):
                 try:
                     if event.type not in receiver_info['subscribed_types']:
                         continue
-                    if cherrypy.request.remote.ip != '127.0.0.1' and not self._user_controller.check_token(receiver_info['token']):
+                    if is_remote and not self._user_controller.check_token(receiver_info['token']):
                         raise cherrypy.HTTPError(401, 'invalid_token')
-                    receiver_info['socket'].send(msgpack.dumps(event.serialize()), binary=True)
+                    receiver_info['socket'].send(payload, binary=True)
                 except cherrypy.HTTPError as ex:  # As might be caught from the `check_token` function
                     receiver_info['socket'].close(ex.code, ex.message)
                 except Exception as ex:
@@ -494,7 +671,7 @@ class WebInterface(object):
         """
         return self._gateway_api.module_discover_start()
 
-    @openmotics_api(auth=True)
+    @openmotics_api(auth=True, invalidates=True)
     def module_discover_stop(self):
         """
         Stop the module discover mode on the master.
@@ -770,9 +947,9 @@ class WebInterface(object):
             'id', 'act', 'csetp', 'output0', 'output1', 'outside', 'mode'.
         :rtype: dict
         """
-        return self._thermostat_controller.v0_get_thermostat_status()
+        return self._load_with_fallback('thermostat_status', self._thermostat_controller.v0_get_thermostat_status)
 
-    @openmotics_api(auth=True, check=types(thermostat=int, temperature=float))
+    @openmotics_api(auth=True, check=types(thermostat=int, temperature=float), invalidates=True)
     def set_current_setpoint(self, thermostat, temperature):
         """
         Set the current setpoint of a thermostat.
@@ -786,7 +963,7 @@ class WebInterface(object):
         """
         return self._thermostat_controller.v0_set_current_setpoint(thermostat, temperature)
 
-    @openmotics_api(auth=True, check=types(thermostat_on=bool, automatic=bool, setpoint=int, cooling_mode=bool, cooling_on=bool))
+    @openmotics_api(auth=True, check=types(thermostat_on=bool, automatic=bool, setpoint=int, cooling_mode=bool, cooling_on=bool), invalidates=True)
     def set_thermostat_mode(self, thermostat_on, automatic=None, setpoint=None, cooling_mode=False, cooling_on=False):
         """
         Set the global mode of the thermostats. Thermostats can be on or off (thermostat_on),
@@ -814,7 +991,7 @@ class WebInterface(object):
 
         return {'status': 'OK'}
 
-    @openmotics_api(auth=True, check=types(thermostat_id=int, automatic=bool, setpoint=int))
+    @openmotics_api(auth=True, check=types(thermostat_id=int, automatic=bool, setpoint=int), invalidates=True)
     def set_per_thermostat_mode(self, thermostat_id, automatic, setpoint):
         """
         Set the thermostat mode of a given thermostat. Thermostats can be set to automatic or
@@ -837,7 +1014,7 @@ class WebInterface(object):
         :returns: dict with ASB0-ASB31.
         :rtype: dict
         """
-        return self._thermostat_controller.v0_get_airco_status()
+        return self._load_with_fallback('airco_status', self._thermostat_controller.v0_get_airco_status)
 
     @openmotics_api(auth=True, check=types(thermostat_id=int, airco_on=bool))
     def set_airco_status(self, thermostat_id, airco_on):
@@ -853,7 +1030,7 @@ class WebInterface(object):
         """
         return self._thermostat_controller.v0_set_airco_status(thermostat_id, airco_on)
 
-    @openmotics_api(auth=True)
+    @openmotics_api(auth=True, cache='short')
     def get_sensor_temperature_status(self):
         """
         Get the current temperature of all sensors.
@@ -861,9 +1038,9 @@ class WebInterface(object):
         :returns: 'status': list of 32 temperatures, 1 for each sensor.
         :rtype: dict
         """
-        return {'status': self._gateway_api.get_sensors_temperature_status()}
+        return {'status': self._load_with_fallback('sensor_temperature_status', self._gateway_api.get_sensors_temperature_status)}
 
-    @openmotics_api(auth=True)
+    @openmotics_api(auth=True, cache='short')
     def get_sensor_humidity_status(self):
         """
         Get the current humidity of all sensors.
@@ -871,9 +1048,9 @@ class WebInterface(object):
         :returns: 'status': List of 32 bytes, 1 for each sensor.
         :rtype: dict
         """
-        return {'status': self._gateway_api.get_sensors_humidity_status()}
+        return {'status': self._load_with_fallback('sensor_humidity_status', self._gateway_api.get_sensors_humidity_status)}
 
-    @openmotics_api(auth=True)
+    @openmotics_api(auth=True, cache='short')
     def get_sensor_brightness_status(self):
         """
         Get the current brightness of all sensors.
@@ -881,9 +1058,9 @@ class WebInterface(object):
         :returns: 'status': List of 32 bytes, 1 for each sensor.
         :rtype: dict
         """
-        return {'status': self._gateway_api.get_sensors_brightness_status()}
+        return {'status': self._load_with_fallback('sensor_brightness_status', self._gateway_api.get_sensors_brightness_status)}
 
-    @openmotics_api(auth=True, check=types(sensor_id=int, temperature=float, humidity=float, brightness=int))
+    @openmotics_api(auth=True, check=types(sensor_id=int, temperature=float, humidity=float, brightness=int), invalidates=True)
     def set_virtual_sensor(self, sensor_id, temperature, humidity, brightness):
         """
         Set the temperature, humidity and brightness value of a virtual sensor.
@@ -943,10 +1120,12 @@ class WebInterface(object):
             eeprom_extensions.db as a string of bytes.
         :rtype: dict
         """
+        backup = self._gateway_api.get_full_backup()
         cherrypy.response.headers['Content-Type'] = 'application/octet-stream'
-        return self._gateway_api.get_full_backup()
+        cherrypy.response.stream = True  # Send the tar in chunks instead of buffering it
+        return backup
 
-    @openmotics_api(auth=True, plugin_exposed=False)
+    @openmotics_api(auth=True, plugin_exposed=False, invalidates=True)
     def restore_full_backup(self, backup_data):
         """
         Restore a full backup containing the master eeprom and the sqlite databases.
@@ -957,10 +1136,12 @@ class WebInterface(object):
         :returns: dict with 'output' key.
         :rtype: dict
         """
-        data = backup_data.file.read()
-        if not data:
+        backup_file = backup_data.file
+        backup_file.seek(0, os.SEEK_END)
+        if backup_file.tell() == 0:
             raise RuntimeError('backup_data is empty')
-        return self._gateway_api.restore_full_backup(data)
+        backup_file.seek(0)
+        return self._gateway_api.restore_full_backup(backup_file)
 
     @cherrypy.expose
     @cherrypy.tools.authenticated()
@@ -975,7 +1156,7 @@ class WebInterface(object):
         cherrypy.response.headers['Content-Type'] = 'application/octet-stream'
         return self._gateway_api.get_master_backup()
 
-    @openmotics_api(auth=True)
+    @openmotics_api(auth=True, invalidates=True)
     def master_restore(self, data):
         """
         Restore a backup of the eeprom of the master.
@@ -1001,7 +1182,7 @@ class WebInterface(object):
         :rtype: dict
         """
         try:
-            errors = self._gateway_api.master_error_list()
+            errors = self._load_with_fallback('master_errors', self._gateway_api.master_error_list)
         except Exception:
             # In case of communications problems with the master.
             errors = []
@@ -1029,26 +1210,28 @@ class WebInterface(object):
         :param id: The id of the output_configuration
         :param fields: The fields of the output_configuration to get, None if all
         """
+        _check_fields(fields, OutputSerializer)
         return {'config': OutputSerializer.serialize(output_dto=self._output_controller.load_output(output_id=id),
                                                      fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_output_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all output_configurations.
         :param fields: The field of the output_configuration to get, None if all
         """
+        _check_fields(fields, OutputSerializer)
         return {'config': [OutputSerializer.serialize(output_dto=output, fields=fields)
                            for output in self._output_controller.load_outputs()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_output_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one output_configuration. """
         data = OutputSerializer.deserialize(config)
         self._output_controller.save_outputs([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_output_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple output_configurations. """
         data = [OutputSerializer.deserialize(entry) for entry in config]
@@ -1064,26 +1247,28 @@ class WebInterface(object):
         :param id: The id of the shutter_configuration
         :param fields: The fields of the shutter_configuration to get, None if all
         """
+        _check_fields(fields, ShutterSerializer)
         return {'config': ShutterSerializer.serialize(shutter_dto=self._shutter_controller.load_shutter(id),
                                                       fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_shutter_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all shutter_configurations.
         :param fields: The fields of the shutter_configuration to get, None if all
         """
+        _check_fields(fields, ShutterSerializer)
         return {'config': [ShutterSerializer.serialize(shutter_dto=shutter, fields=fields)
                            for shutter in self._shutter_controller.load_shutters()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_shutter_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one shutter_configuration. """
         data = ShutterSerializer.deserialize(config)
         self._shutter_controller.save_shutters([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_shutter_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple shutter_configurations. """
         data = [ShutterSerializer.deserialize(entry) for entry in config]
@@ -1097,26 +1282,28 @@ class WebInterface(object):
         :param id: The id of the shutter_group_configuration
         :param fields: The field of the shutter_group_configuration to get, None if all
         """
+        _check_fields(fields, ShutterGroupSerializer)
         return {'config': ShutterGroupSerializer.serialize(shutter_group_dto=self._shutter_controller.load_shutter_group(id),
                                                            fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_shutter_group_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all shutter_group_configurations.
         :param fields: The field of the shutter_group_configuration to get, None if all
         """
+        _check_fields(fields, ShutterGroupSerializer)
         return {'config': [ShutterGroupSerializer.serialize(shutter_group_dto=shutter_group, fields=fields)
                            for shutter_group in self._shutter_controller.load_shutter_groups()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_shutter_group_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one shutter_group_configuration. """
         data = ShutterGroupSerializer.deserialize(config)
         self._shutter_controller.save_shutter_groups([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_shutter_group_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple shutter_group_configurations. """
         data = [ShutterGroupSerializer.deserialize(entry) for entry in config]
@@ -1132,26 +1319,28 @@ class WebInterface(object):
         :param id: The id of the input_configuration
         :param fields: The field of the input_configuration to get, None if all
         """
+        _check_fields(fields, InputSerializer)
         return {'config': InputSerializer.serialize(input_dto=self._input_controller.load_input(input_id=id),
                                                     fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_input_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all input_configurations.
         :param fields: The field of the input_configuration to get, None if all
         """
+        _check_fields(fields, InputSerializer)
         return {'config': [InputSerializer.serialize(input_dto=input_, fields=fields)
                            for input_ in self._input_controller.load_inputs()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_input_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one input_configuration. """
         data = InputSerializer.deserialize(config)
         self._input_controller.save_inputs([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_input_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple input_configurations. """
         data = [InputSerializer.deserialize(entry) for entry in config]
@@ -1167,26 +1356,28 @@ class WebInterface(object):
         :param id: The id of the thermostat_configuration
         :param fields: The field of the thermostat_configuration to get, None if all
         """
+        _check_fields(fields, ThermostatSerializer)
         return {'config': ThermostatSerializer.serialize(thermostat_dto=self._thermostat_controller.load_heating_thermostat(id),
                                                          fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_thermostat_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all thermostat_configurations.
         :param fields: The field of the thermostat_configuration to get, None if all
         """
+        _check_fields(fields, ThermostatSerializer)
         return {'config': [ThermostatSerializer.serialize(thermostat_dto=thermostat, fields=fields)
                            for thermostat in self._thermostat_controller.load_heating_thermostats()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_thermostat_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one thermostat_configuration. """
         data = ThermostatSerializer.deserialize(config)
         self._thermostat_controller.save_heating_thermostats([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_thermostat_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple thermostat_configurations. """
         data = [ThermostatSerializer.deserialize(entry) for entry in config]
@@ -1202,26 +1393,28 @@ class WebInterface(object):
         :param id: The id of the sensor_configuration
         :param fields: The field of the sensor_configuration to get, None if all
         """
+        _check_fields(fields, SensorSerializer)
         return {'config': SensorSerializer.serialize(sensor_dto=self._sensor_controller.load_sensor(sensor_id=id),
                                                      fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_sensor_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all sensor_configurations.
         :param fields: The field of the sensor_configuration to get, None if all
         """
+        _check_fields(fields, SensorSerializer)
         return {'config': [SensorSerializer.serialize(sensor_dto=sensor, fields=fields)
                            for sensor in self._sensor_controller.load_sensors()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_sensor_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one sensor_configuration. """
         data = SensorSerializer.deserialize(config)
         self._sensor_controller.save_sensors([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_sensor_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple sensor_configurations. """
         data = [SensorSerializer.deserialize(entry) for entry in config]
@@ -1244,7 +1437,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_pump_group_configuration(id, fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_pump_group_configurations(self, fields=None):
         """
         Get all pump_group_configurations.
@@ -1256,7 +1449,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_pump_group_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_pump_group_configuration(self, config):
         """
         Set one pump_group_configuration.
@@ -1267,7 +1460,7 @@ class WebInterface(object):
         self._thermostat_controller.v0_set_pump_group_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_pump_group_configurations(self, config):
         """
         Set multiple pump_group_configurations.
@@ -1287,26 +1480,28 @@ class WebInterface(object):
         :param id: The id of the cooling_configuration
         :param fields: The field of the cooling_configuration to get, None if all
         """
+        _check_fields(fields, ThermostatSerializer)
         return {'config': ThermostatSerializer.serialize(thermostat_dto=self._thermostat_controller.load_cooling_thermostat(id),
                                                          fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_cooling_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all cooling_configurations.
         :param fields: The field of the cooling_configuration to get, None if all
         """
+        _check_fields(fields, ThermostatSerializer)
         return {'config': [ThermostatSerializer.serialize(thermostat_dto=thermostat, fields=fields)
                            for thermostat in self._thermostat_controller.load_cooling_thermostats()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_cooling_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one cooling_configuration. """
         data = ThermostatSerializer.deserialize(config)
         self._thermostat_controller.save_cooling_thermostats([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_cooling_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple cooling_configurations. """
         data = [ThermostatSerializer.deserialize(entry) for entry in config]
@@ -1329,7 +1524,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_cooling_pump_group_configuration(id, fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_cooling_pump_group_configurations(self, fields=None):
         """
         Get all cooling_pump_group_configurations.
@@ -1341,7 +1536,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_cooling_pump_group_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_cooling_pump_group_configuration(self, config):
         """
         Set one cooling_pump_group_configuration.
@@ -1352,7 +1547,7 @@ class WebInterface(object):
         self._thermostat_controller.v0_set_cooling_pump_group_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_cooling_pump_group_configurations(self, config):
         """
         Set multiple cooling_pump_group_configurations.
@@ -1363,7 +1558,7 @@ class WebInterface(object):
         self._thermostat_controller.v0_set_cooling_pump_group_configurations(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_global_rtd10_configuration(self, fields=None):
         """
         Get the global_rtd10_configuration.
@@ -1375,7 +1570,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_global_rtd10_configuration(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_global_rtd10_configuration(self, config):
         """
         Set the global_rtd10_configuration.
@@ -1400,7 +1595,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_rtd10_heating_configuration(id, fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_rtd10_heating_configurations(self, fields=None):
         """
         Get all rtd10_heating_configurations.
@@ -1412,7 +1607,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_rtd10_heating_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_rtd10_heating_configuration(self, config):
         """
         Set one rtd10_heating_configuration.
@@ -1423,7 +1618,7 @@ class WebInterface(object):
         self._thermostat_controller.v0_set_rtd10_heating_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_rtd10_heating_configurations(self, config):
         """
         Set multiple rtd10_heating_configurations.
@@ -1448,7 +1643,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_rtd10_cooling_configuration(id, fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_rtd10_cooling_configurations(self, fields=None):
         """
         Get all rtd10_cooling_configurations.
@@ -1460,7 +1655,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_rtd10_cooling_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_rtd10_cooling_configuration(self, config):
         """
         Set one rtd10_cooling_configuration.
@@ -1471,7 +1666,7 @@ class WebInterface(object):
         self._thermostat_controller.v0_set_rtd10_cooling_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_rtd10_cooling_configurations(self, config):
         """
         Set multiple rtd10_cooling_configurations.
@@ -1491,26 +1686,28 @@ class WebInterface(object):
         :param id: The id of the group_action_configuration
         :param fields: The field of the group_action_configuration to get, None if all
         """
+        _check_fields(fields, GroupActionSerializer)
         return {'config': GroupActionSerializer.serialize(group_action_dto=self._group_action_controller.load_group_action(id),
                                                           fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_group_action_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all group_action_configurations.
         :param fields: The field of the group_action_configuration to get, None if all
         """
+        _check_fields(fields, GroupActionSerializer)
         return {'config': [GroupActionSerializer.serialize(group_action_dto=group_action, fields=fields)
                            for group_action in self._group_action_controller.load_group_actions()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_group_action_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one group_action_configuration. """
         data = GroupActionSerializer.deserialize(config)
         self._group_action_controller.save_group_actions([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_group_action_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple group_action_configurations. """
         data = [GroupActionSerializer.deserialize(entry) for entry in config]
@@ -1545,7 +1742,7 @@ class WebInterface(object):
         """
         return {'config': self._gateway_api.get_scheduled_action_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_scheduled_action_configuration(self, config):
         """
         Set one scheduled_action_configuration.
@@ -1556,7 +1753,7 @@ class WebInterface(object):
         self._gateway_api.set_scheduled_action_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_scheduled_action_configurations(self, config):
         """
         Set multiple scheduled_action_configurations.
@@ -1576,33 +1773,35 @@ class WebInterface(object):
         :param id: The id of the pulse_counter_configuration
         :param fields: The field of the pulse_counter_configuration to get, None if all
         """
+        _check_fields(fields, PulseCounterSerializer)
         return {'config': PulseCounterSerializer.serialize(pulse_counter_dto=self._pulse_counter_controller.load_pulse_counter(pulse_counter_id=id),
                                                            fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_pulse_counter_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all pulse_counter_configurations.
         :param fields: The field of the pulse_counter_configuration to get, None if all
         """
+        _check_fields(fields, PulseCounterSerializer)
         return {'config': [PulseCounterSerializer.serialize(pulse_counter_dto=pulse_counter, fields=fields)
                            for pulse_counter in self._pulse_counter_controller.load_pulse_counters()]}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_pulse_counter_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one pulse_counter_configuration. """
         data = PulseCounterSerializer.deserialize(config)
         self._pulse_counter_controller.save_pulse_counters([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_pulse_counter_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple pulse_counter_configurations. """
         data = [PulseCounterSerializer.deserialize(entry) for entry in config]
         self._pulse_counter_controller.save_pulse_counters(data)
         return {}
 
-    @openmotics_api(auth=True, check=types(amount=int))
+    @openmotics_api(auth=True, check=types(amount=int), invalidates=True)
     def set_pulse_counter_amount(self, amount):  # type: (int) -> Dict
         """
         Set the number of pulse counters. The minimum is 24, these are the pulse counters
@@ -1615,7 +1814,7 @@ class WebInterface(object):
     def get_pulse_counter_status(self):  # type: () -> Dict[str, List[Optional[int]]]
         """ Get the pulse counter values. """
         values = self._pulse_counter_controller.get_values()
-        return {'counters': [values[number] for number in sorted(values.keys())]}
+        return {'counters': [value for _, value in sorted(values.items())]}
 
     @openmotics_api(auth=True, check=types(pulse_counter_id=int, value=int))
     def set_pulse_counter_status(self, pulse_counter_id, value):  # type: (int, int) -> Dict
@@ -1627,7 +1826,7 @@ class WebInterface(object):
 
     # Startup actions
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_startup_action_configuration(self, fields=None):
         """
         Get the startup_action_configuration.
@@ -1639,7 +1838,7 @@ class WebInterface(object):
         """
         return {'config': self._gateway_api.get_startup_action_configuration(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_startup_action_configuration(self, config):
         """
         Set the startup_action_configuration.
@@ -1650,7 +1849,7 @@ class WebInterface(object):
         self._gateway_api.set_startup_action_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_dimmer_configuration(self, fields=None):
         """
         Get the dimmer_configuration.
@@ -1662,7 +1861,7 @@ class WebInterface(object):
         """
         return {'config': self._gateway_api.get_dimmer_configuration(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_dimmer_configuration(self, config):
         """
         Set the dimmer_configuration.
@@ -1673,7 +1872,7 @@ class WebInterface(object):
         self._gateway_api.set_dimmer_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_global_thermostat_configuration(self, fields=None):
         """
         Get the global_thermostat_configuration.
@@ -1685,7 +1884,7 @@ class WebInterface(object):
         """
         return {'config': self._thermostat_controller.v0_get_global_thermostat_configuration(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_global_thermostat_configuration(self, config):
         """
         Set the global_thermostat_configuration.
@@ -1710,7 +1909,7 @@ class WebInterface(object):
         """
         return {'config': self._gateway_api.get_can_led_configuration(id, fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_can_led_configurations(self, fields=None):
         """
         Get all can_led_configurations.
@@ -1722,7 +1921,7 @@ class WebInterface(object):
         """
         return {'config': self._gateway_api.get_can_led_configurations(fields)}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_can_led_configuration(self, config):
         """
         Set one can_led_configuration.
@@ -1733,7 +1932,7 @@ class WebInterface(object):
         self._gateway_api.set_can_led_configuration(config)
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_can_led_configurations(self, config):
         """
         Set multiple can_led_configurations.
@@ -1753,37 +1952,39 @@ class WebInterface(object):
         :param id: The id of the room_configuration
         :param fields: The fields of the room_configuration to get, None if all
         """
-        try:
-            room_dto = self._room_controller.load_room(room_id=id)
-        except DoesNotExist:
-            if 0 <= id < 100:
-                room_dto = RoomDTO(id=id)
-            else:
-                raise
+        _check_fields(fields, RoomSerializer)
+        room_dto = self._room_controller.load_room_or_none(room_id=id)
+        if room_dto is None:
+            if not 0 <= id < 100:
+                raise DoesNotExist('Room {0} does not exist'.format(id))
+            room_dto = RoomDTO(id=id)  # Unconfigured rooms are reported empty
         return {'config': RoomSerializer.serialize(room_dto=room_dto,
                                                    fields=fields)}
 
-    @openmotics_api(auth=True, check=types(fields='json'))
+    @openmotics_api(auth=True, check=types(fields='json'), cache='normal')
     def get_room_configurations(self, fields=None):  # type: (Optional[List[str]]) -> Dict[str, Any]
         """
         Get all room_configuration.
         :param fields: The field of the room_configuration to get, None if all
         """
+        _check_fields(fields, RoomSerializer)
         data = []
         rooms = {room.id: room for room in self._room_controller.load_rooms()}
         for i in range(100):
-            room = rooms.get(i, RoomDTO(id=i))
+            room = rooms.get(i)
+            if room is None:
+                room = RoomDTO(id=i)
             data.append(RoomSerializer.serialize(room_dto=room, fields=fields))
         return {'config': data}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_room_configuration(self, config):  # type: (Dict[Any, Any]) -> Dict
         """ Set one room_configuration. """
         data = RoomSerializer.deserialize(config)
         self._room_controller.save_rooms([data])
         return {}
 
-    @openmotics_api(auth=True, check=types(config='json'))
+    @openmotics_api(auth=True, check=types(config='json'), invalidates=True)
     def set_room_configurations(self, config):  # type: (List[Dict[Any, Any]]) -> Dict
         """ Set multiple room_configuration. """
         data = [RoomSerializer.deserialize(entry) for entry in config]
@@ -1936,7 +2137,7 @@ class WebInterface(object):
         :returns: dict with 'data': comma separated list of Bytes
         :rtype: dict
         """
-        if mode not in ['S', 'G']:
+        if mode not in ('S', 'G'):
             raise ValueError("mode not in [S, G]: %s" % mode)
 
         if len(command) != 3:
@@ -1948,7 +2149,7 @@ class WebInterface(object):
             bdata = []
 
         ret = self._gateway_api.do_raw_energy_command(address, mode, command, bdata)
-        return {'data': ",".join([str(d) for d in ret])}
+        return {'data': ",".join(map(str, ret))}
 
     @openmotics_api(auth=True)
     def get_version(self):
@@ -1961,6 +2162,17 @@ class WebInterface(object):
         return {'version': self._gateway_api.get_main_version(),
                 'gateway': gateway.__version__}
 
+    @openmotics_api(auth=True, plugin_exposed=False)
+    def get_cache_stats(self):
+        """
+        Get the hit/miss counters of the cached API calls, and how often stale data was served.
+
+        :returns: 'stats': dict with 'hits', 'misses' and 'stale_served' counters per call.
+        :rtype: dict
+        """
+        _ = self
+        return {'stats': dict((kind, dict(counters)) for kind, counters in _response_cache.stats.items())}
+
     @openmotics_api(auth=True)
     def get_system_info(self):
         operating_system = System.get_operating_system()
@@ -2218,7 +2430,7 @@ class WebInterface(object):
                         definitions[_source][_metric_type] = definition
         return {'definitions': definitions}
 
-    @openmotics_api(check=types(confirm=bool), auth=True, plugin_exposed=False)
+    @openmotics_api(check=types(confirm=bool), auth=True, plugin_exposed=False, invalidates=True)
     def factory_reset(self, username, password, confirm=False):
         success, _ = self._user_controller.login(username, password)
         if not success:
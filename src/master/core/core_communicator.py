@@ -29,7 +29,7 @@ from master.core.core_command import CoreCommandSpec
 from serial_utils import CommunicationTimedOutException, printable
 
 if False:  # MYPY
-    from typing import Optional, Dict, Any
+    from typing import Optional, Dict, Any, List, Tuple
 
 logger = logging.getLogger('openmotics')
 
@@ -194,25 +194,41 @@ class CoreCommunicator(object):
         :param fields: A dictionary with the command input field values
         :param timeout: maximum allowed time before a CommunicationTimedOutException is raised
         """
-        cid = self._get_cid()
-        consumer = Consumer(command, cid)
-        command = consumer.command
+        return self.do_commands([(command, fields)], timeout=timeout)[0]
 
-        try:
-            self._consumers.setdefault(consumer.get_header(), []).append(consumer)
-            self._send_command(cid, command, fields)
-        except Exception:
-            self.discard_cid(cid)
-            raise
+    def do_commands(self, commands, timeout=2):
+        # type: (List[Tuple[CoreCommandSpec, Dict[str, Any]]], Optional[int]) -> List[Optional[Dict[str, Any]]]
+        """
+        Send multiple commands over the serial port without waiting for the answers in between, and
+        block until all answers are received. This way, only a single round-trip is needed.
+        If the Core does not respond within the timeout period, a CommunicationTimedOutException is raised
+
+        :param commands: A list of (command specification, command input field values) tuples
+        :param timeout: maximum allowed time per answer before a CommunicationTimedOutException is raised
+        """
+        consumers = []
+        for command, fields in commands:
+            cid = self._get_cid()
+            consumer = Consumer(command, cid)
+            try:
+                self._consumers.setdefault(consumer.get_header(), []).append(consumer)
+                self._send_command(cid, consumer.command, fields)
+            except Exception:
+                self.discard_cid(cid)
+                raise
+            consumers.append(consumer)
 
         try:
-            result = None
-            if isinstance(consumer, Consumer) and timeout is not None:
-                result = consumer.get(timeout)
+            results = []
+            for consumer in consumers:
+                result = None
+                if timeout is not None:
+                    result = consumer.get(timeout)
+                results.append(result)
             self._last_success = time.time()
             self._communication_stats['calls_succeeded'].append(time.time())
             self._communication_stats['calls_succeeded'] = self._communication_stats['calls_succeeded'][-50:]
-            return result
+            return results
         except CommunicationTimedOutException:
             self._communication_stats['calls_timedout'].append(time.time())
             self._communication_stats['calls_timedout'] = self._communication_stats['calls_timedout'][-50:]
@@ -25,7 +25,7 @@ from master.core.events import Event
 from master.core.memory_types import MemoryAddress
 
 if False:  # MYPY
-    from typing import List, Dict
+    from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger("openmotics")
 
@@ -89,24 +89,31 @@ class MemoryFile(object):
                 page_data[address.offset + index] = data_byte
             self.write_page(address.page, page_data)
 
-    def read_page(self, page):
-        def _read_page():
-            page_data = []
-            for i in range(self._page_length // 32):
-                page_data += self._core_communicator.do_command(
-                    command=CoreAPI.memory_read(),
-                    fields={'type': self.type, 'page': page, 'start': i * 32, 'length': 32},
-                    timeout=MemoryFile.READ_TIMEOUT
-                )['data']
-            return page_data
+    def _read_page(self, page):  # type: (int) -> List[int]
+        """ Reads a page from the Core, pipelining the reads of its chunks in a single round-trip """
+        commands = [(CoreAPI.memory_read(), {'type': self.type, 'page': page, 'start': i * 32, 'length': 32})
+                    for i in range(self._page_length // 32)]
+        page_data = []  # type: List[int]
+        for result in self._core_communicator.do_commands(commands, timeout=MemoryFile.READ_TIMEOUT):
+            page_data += result['data']
+        return page_data
 
+    def read_page(self, page):
         if self.type == MemoryTypes.FRAM:
-            return _read_page()
+            return self._read_page(page)
 
         if page not in self._cache:
-            self._cache[page] = _read_page()
+            self._cache[page] = self._read_page(page)
         return copy.copy(self._cache[page])
 
+    def preload_pages(self, pages):  # type: (Iterable[int]) -> None
+        """ Loads the given pages into the cache """
+        if self.type != MemoryTypes.EEPROM:
+            return  # Only the EEPROM is cached
+        for page in sorted(set(pages)):
+            if page not in self._cache:
+                self._cache[page] = self._read_page(page)
+
     def write_page(self, page, data):
         cached_data = None
         if self.type == MemoryTypes.EEPROM:
@@ -129,10 +136,15 @@ class MemoryFile(object):
         if self.type == MemoryTypes.EEPROM:
             self._cache[page] = data
 
-    def activate(self):
+    def activate(self, timeout=ACTIVATE_TIMEOUT):  # type: (Optional[int]) -> None
+        """
+        Activates the written EEPROM data. When `timeout` is None, the activation is only
+        requested and this call returns immediately. The EEPROM_ACTIVATE event the Core sends
+        once it's done will clear the cache and notify the eeprom change subscriber.
+        """
         if self.type == MemoryTypes.EEPROM:
             logger.info('MEMORY.{0}: Activate'.format(self.type))
-            self._core_communicator.do_basic_action(action_type=200, action=1, timeout=MemoryFile.ACTIVATE_TIMEOUT)
+            self._core_communicator.do_basic_action(action_type=200, action=1, timeout=timeout)
 
     def invalidate_cache(self, page=None):
         pages = [page]
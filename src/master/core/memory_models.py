@@ -81,7 +81,7 @@ class OutputConfiguration(MemoryModelDefinition):
     @property
     def is_shutter(self):
         group = self.id % 8 // 2
-        return not getattr(self.module.shutter_config, 'are_{0}_outputs'.format(['01', '23', '45', '67'][group]))
+        return not getattr(self.module.shutter_config, ('are_01_outputs', 'are_23_outputs', 'are_45_outputs', 'are_67_outputs')[group])
 
 
 class InputModuleConfiguration(MemoryModelDefinition):
@@ -25,7 +25,7 @@ import ujson as json
 from ioc import INJECTED, Inject
 
 if False:  # MYPY
-    from typing import Any, Dict
+    from typing import Any, Dict, Iterable, Set
     from master.core.memory_file import MemoryFile
 
 logger = logging.getLogger("openmotics")
@@ -149,6 +149,23 @@ class MemoryModelDefinition(object):
                 raise ValueError('Unknown field: {0}', field_name)
         return instance
 
+    @classmethod
+    @Inject
+    def preload(cls, ids, memory_files=INJECTED):  # type: (Iterable[int], Dict[str, MemoryFile]) -> None
+        """
+        Loads the memory pages used by the given instances in bulk, so creating
+        these instances afterwards doesn't require separate reads.
+        """
+        pages = {}  # type: Dict[str, Set[int]]
+        compositions = cls._get_fields()['compositions']
+        for id in ids:
+            addresses = list(cls._get_address_cache(id).values())
+            addresses += [composition._field.get_address(id) for _, composition in compositions]
+            for address in addresses:
+                pages.setdefault(address.memory_type, set()).add(address.page)
+        for memory_type, memory_pages in pages.items():
+            memory_files[memory_type].preload_pages(memory_pages)
+
     @classmethod
     def _get_fields(cls):
         """ Get the fields defined by an EepromModel child. """
@@ -100,8 +100,8 @@ class PluginRunner:
         class Service:
             def __init__(self, runner):
                 self.runner = runner
-                # Set the user controller, required to check the auth token
-                self._user_controller = webinterface._user_controller
+                # Set the token check, required by the authentication tool
+                self._auth_check_token = webinterface._user_controller.check_token
 
             def _cp_dispatch(self, vpath):
                 method = vpath.pop()
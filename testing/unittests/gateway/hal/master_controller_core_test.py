@@ -15,6 +15,7 @@ from master.core.core_api import CoreAPI
 from master.core.memory_file import MemoryTypes
 from master.core.core_communicator import BackgroundConsumer
 from master.core.memory_models import InputConfiguration
+from master.core.memory_types import MemoryActivator
 from master.core.ucan_communicator import UCANCommunicator
 from six.moves import map
 
@@ -55,11 +56,13 @@ class MasterCoreControllerTest(unittest.TestCase):
                 (InputDTO(id=2, name='bar', module_type='I'), ['id', 'name', 'module_type'])]
         input_mock = mock.Mock(InputConfiguration)
         with mock.patch.object(InputConfiguration, 'deserialize', return_value=input_mock) as deserialize, \
-                mock.patch.object(input_mock, 'save', return_value=None) as save:
+                mock.patch.object(input_mock, 'save', return_value=None) as save, \
+                mock.patch.object(MemoryActivator, 'activate') as activate:
             controller.save_inputs(data)
             self.assertIn(mock.call({'id': 1, 'name': 'foo'}), deserialize.call_args_list)
             self.assertIn(mock.call({'id': 2, 'name': 'bar'}), deserialize.call_args_list)
-            save.assert_called_with()
+            save.assert_called_with(activate=False)
+            activate.assert_called_once_with()
 
     def test_inputs_with_status(self):
         controller = get_core_controller_dummy()
@@ -75,6 +78,37 @@ class MasterCoreControllerTest(unittest.TestCase):
             controller.get_recent_inputs()
             get.assert_called_with()
 
+    def test_getter_wakes_synchronization(self):
+        controller = get_core_controller_dummy()
+        controller._synchronization_wakeup.clear()
+        controller.get_output_statuses()
+        self.assertTrue(controller._states_requested)
+        self.assertTrue(controller._synchronization_wakeup.is_set())
+        controller._synchronization_wakeup.clear()
+        controller.get_sensor_temperature(0)  # Already requested, the refresh is pending
+        self.assertFalse(controller._synchronization_wakeup.is_set())
+
+    def test_refresh_output_states(self):
+        controller = get_core_controller_dummy({'output': 2, 'input': 0, 'sensor': 0})
+        details = dict((i, {'status': 0, 'timer': 0, 'dimmer': 0}) for i in range(16))
+        details[0] = {'status': 1, 'timer': 0, 'dimmer': 100}
+        batches = []
+
+        def do_commands(commands, timeout=2):
+            _ = timeout
+            batches.append([fields['device_nr'] for _, fields in commands])
+            return [details[fields['device_nr']] for _, fields in commands]
+
+        controller._master_communicator.do_commands = mock.Mock(side_effect=do_commands)
+        controller._refresh_output_states()  # One round-trip per output module
+        self.assertEqual([list(range(8)), list(range(8, 16))], batches)
+        self.assertEqual({'id': 0, 'status': 1, 'ctimer': 0, 'dimmer': 100}, controller._output_states[0])
+        self.assertEqual(0, controller._output_states[15]['status'])
+        details[0]['dimmer'] = 50
+        controller._refresh_output_states()
+        self.assertEqual(4, len(batches))
+        self.assertEqual(50, controller._output_states[0]['dimmer'])
+
     def test_event_consumer(self):
         with mock.patch.object(gateway.hal.master_controller_core, 'BackgroundConsumer',
                                return_value=None) as new_consumer:
@@ -176,6 +210,31 @@ class MasterInputState(unittest.TestCase):
         with mock.patch.object(time, 'time', return_value=60):
             self.assertTrue(state.should_refresh())
 
+    def test_refresh_after_event(self):
+        from gateway.hal.master_controller_core import MasterCoreEvent, MasterInputState
+        state = MasterInputState()
+        with mock.patch.object(time, 'time', return_value=30):
+            self.assertEqual([], state.refresh([0b00000110, 0b00000000]))
+            state.handle_event(MasterCoreEvent({'type': 1, 'action': 0, 'device_nr': 2, 'data': {}}))
+            state.handle_event(MasterCoreEvent({'type': 1, 'action': 1, 'device_nr': 9, 'data': {}}))
+            # The master missed the events, so its statuses equal those of the previous refresh
+            events = state.refresh([0b00000110, 0b00000000])
+            self.assertEqual([2, 9], [event.data['id'] for event in events])
+            self.assertEqual([True, False], [event.data['status'] for event in events])
+            self.assertIn({'id': 9, 'status': 0}, state.get_inputs())
+            self.assertEqual([], state.refresh([0b00000110, 0b00000000]))
+
+    def test_diff_packed_status(self):
+        from gateway.hal.master_controller_core import _diff_packed_status
+        packed_status = bytearray()
+        changes = _diff_packed_status(bytearray([0b00000101]), packed_status)
+        self.assertEqual([(0, 1), (1, 0), (2, 1), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0)], changes)
+        self.assertEqual(bytearray([0b00000101]), packed_status)
+        self.assertEqual([], _diff_packed_status(bytearray([0b00000101]), packed_status))
+        changes = _diff_packed_status(bytearray([0b10000100, 0b00000000]), packed_status)
+        self.assertEqual([(0, 0), (7, 1)] + [(i, 0) for i in range(8, 16)], changes)
+        self.assertEqual(bytearray([0b10000100, 0b00000000]), packed_status)
+
     def test_recent(self):
         from gateway.hal.master_controller_core import MasterCoreEvent, MasterInputState
         state = MasterInputState()
@@ -0,0 +1,128 @@
+# Copyright (C) 2020 OpenMotics BV
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests for the output controller and its DTO cache.
+"""
+
+from __future__ import absolute_import
+import unittest
+import xmlrunner
+from peewee import SqliteDatabase
+from mock import Mock
+
+from ioc import SetTestMode, SetUpTestInjections
+from gateway.base_controller import BaseController
+from gateway.dto import OutputDTO
+from gateway.models import Output, Room
+from gateway.output_controller import OutputController
+
+MODELS = [Output, Room]
+
+
+class OutputControllerTest(unittest.TestCase):
+    """ Tests for OutputController. """
+
+    @classmethod
+    def setUpClass(cls):
+        SetTestMode()
+        cls.test_db = SqliteDatabase(':memory:')
+
+    def setUp(self):
+        self.test_db.bind(MODELS, bind_refs=False, bind_backrefs=False)
+        self.test_db.connect()
+        self.test_db.create_tables(MODELS)
+        self.master_controller = Mock()
+        self.master_controller.load_output = Mock(side_effect=lambda output_id: OutputDTO(output_id, name='output {0}'.format(output_id)))
+        SetUpTestInjections(master_controller=self.master_controller,
+                            maintenance_controller=Mock())
+        self.controller = OutputController()
+        for number in range(3):
+            Output.create(number=number)
+
+    def tearDown(self):
+        self.test_db.drop_tables(MODELS)
+        self.test_db.close()
+
+    def test_cached_outputs(self):
+        outputs = self.controller.load_outputs()
+        self.assertEqual(['output 0', 'output 1', 'output 2'], [output.name for output in outputs])
+        self.assertEqual(3, self.master_controller.load_output.call_count)
+        self.controller.load_outputs()
+        self.assertEqual(3, self.master_controller.load_output.call_count)
+        BaseController.invalidate_caches()
+        self.controller.load_outputs()
+        self.assertEqual(6, self.master_controller.load_output.call_count)
+
+    def test_returns_copies(self):
+        outputs = self.controller.load_outputs()
+        outputs[0].name = 'changed'
+        outputs.pop()
+        outputs = self.controller.load_outputs()
+        self.assertEqual(['output 0', 'output 1', 'output 2'], [output.name for output in outputs])
+
+    def test_invalidation_during_load(self):
+        original_load = self.controller._load_outputs
+
+        def _load_outputs():
+            outputs = original_load()
+            BaseController.invalidate_caches()  # E.g. a save finishing while the outputs were loaded
+            return outputs
+
+        self.controller._load_outputs = _load_outputs
+        self.controller.load_outputs()
+        self.controller._load_outputs = original_load
+        self.controller.load_outputs()  # The previous load might be stale, so it's not used
+        self.assertEqual(6, self.master_controller.load_output.call_count)
+        self.controller.load_outputs()
+        self.assertEqual(6, self.master_controller.load_output.call_count)
+
+    def test_save_invalidates(self):
+        self.controller.load_outputs()
+        self.controller.save_outputs([(OutputDTO(1, name='new'), ['name'])])
+        self.assertEqual(1, self.master_controller.save_outputs.call_count)
+        self.controller.load_outputs()
+        self.assertEqual(6, self.master_controller.load_output.call_count)
+
+    def test_failed_save_invalidates(self):
+        self.controller.load_outputs()
+        self.master_controller.save_outputs = Mock(side_effect=RuntimeError('failed'))
+        with self.assertRaises(RuntimeError):
+            self.controller.save_outputs([(OutputDTO(1, room=5), ['room'])])
+        outputs = self.controller.load_outputs()
+        self.assertEqual(6, self.master_controller.load_output.call_count)
+        self.assertEqual(5, outputs[1].room)  # The ORM part of the save did go through
+
+    def test_single_output_from_cache(self):
+        self.controller.load_outputs()
+        with self.test_db.atomic():
+            Output.delete().execute()  # Proves the database isn't used anymore
+        output = self.controller.load_output(1)
+        self.assertEqual('output 1', output.name)
+        self.assertEqual(3, self.master_controller.load_output.call_count)
+        output.name = 'changed'
+        self.assertEqual('output 1', self.controller.load_output(1).name)
+
+    def test_single_output_without_cache(self):
+        output = self.controller.load_output(1)  # Nothing cached yet
+        self.assertEqual('output 1', output.name)
+        self.assertEqual(1, self.master_controller.load_output.call_count)
+        self.controller.load_outputs()
+        self.controller.save_outputs([(OutputDTO(1, name='new'), ['name'])])
+        self.controller.load_output(1)  # The list cache was invalidated by the save
+        self.assertEqual(5, self.master_controller.load_output.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=xmlrunner.XMLTestRunner(output='../gw-unit-reports'))
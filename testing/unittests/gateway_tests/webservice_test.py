@@ -0,0 +1,248 @@
+# Copyright (C) 2020 OpenMotics BV
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests for the webservice response cache.
+"""
+
+from __future__ import absolute_import
+import threading
+import time
+import unittest
+import xmlrunner
+import ujson as json
+import cherrypy
+import six
+
+import gateway.webservice
+from gateway.api.serializers import RoomSerializer
+from gateway.dto import RoomDTO
+from gateway.webservice import ResponseCache, WebInterface, _accepts_msgpack, _check_fields, openmotics_api, types
+from serial_utils import CommunicationTimedOutException
+
+
+class Calls(object):
+    """ A minimal API, counting the calls that reach the handlers. """
+
+    _load_with_fallback = six.get_unbound_function(WebInterface._load_with_fallback)
+
+    def __init__(self):
+        self.loads = 0
+        self._last_known_data = {}
+        self.load_status = None
+        self.room_ids = []
+
+    @openmotics_api(check=types(fields='json'), cache='normal')
+    def get_things(self, fields=None):
+        self.loads += 1
+        things = {'a': 1, 'b': 2}
+        if fields is not None:
+            things = {field: things[field] for field in fields}
+        return {'things': things}
+
+    @openmotics_api(cache='short')
+    def get_unserializable(self):
+        self.loads += 1
+        return {'value': object()}
+
+    @openmotics_api(check=types(fields='json'), cache='normal')
+    def get_rooms(self, fields=None):
+        _check_fields(fields, RoomSerializer)
+        return {'config': [RoomSerializer.serialize(RoomDTO(id=room_id), fields) for room_id in self.room_ids]}
+
+    @openmotics_api(cache='short')
+    def get_status(self):
+        self.loads += 1
+        return {'status': self._load_with_fallback('status', self.load_status)}
+
+    @openmotics_api(check=types(config='json'), invalidates=True)
+    def set_things(self, config):
+        _ = config
+        return {}
+
+    @openmotics_api(check=types(id=int))
+    def do_thing(self, id):
+        _ = id
+        return {}
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """ Tests for the ResponseCache and its use by openmotics_api """
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        gateway.webservice._response_cache = self.cache
+        cherrypy.serving.response = cherrypy._cprequest.Response()
+
+    def test_expiry(self):
+        key = ('get_things', False, None)
+        response, token = self.cache.get(key, 100.0)
+        self.assertIsNone(response)
+        self.cache.store(key, token, self.cache.generation, 105.0, ('application/json', 'data'))
+        self.assertEqual((('application/json', 'data'), None), self.cache.get(key, 104.9))
+        response, token = self.cache.get(key, 105.0)
+        self.assertIsNone(response)
+        self.assertIsNotNone(token)
+        self.assertEqual({'get_things': 1}, self.cache.stats['hits'])
+        self.assertEqual({'get_things': 2}, self.cache.stats['misses'])
+
+    def test_generation_guard(self):
+        key = ('get_things', False, None)
+        _, token = self.cache.get(key, 100.0)
+        generation = self.cache.generation
+        self.cache.clear()  # E.g. a setter finished while the response was being loaded
+        self.cache.store(key, token, generation, 105.0, ('application/json', 'stale'))
+        response, _ = self.cache.get(key, 101.0)
+        self.assertIsNone(response)
+
+    def test_fields_keying(self):
+        calls = Calls()
+        all_things = json.loads(calls.get_things())
+        self.assertEqual({'a': 1, 'b': 2}, all_things['things'])
+        some_things = json.loads(calls.get_things(fields=['a']))
+        self.assertEqual({'a': 1}, some_things['things'])
+        self.assertEqual(2, calls.loads)
+        calls.get_things()
+        calls.get_things(fields=['a'])
+        self.assertEqual(2, calls.loads)
+
+    def test_unknown_fields(self):
+        calls = Calls()
+        response = json.loads(calls.get_rooms(fields=['bogus']))  # Rejected, even without any rooms
+        self.assertEqual({'success': False, 'msg': 'Unknown field: bogus'}, response)
+        self.assertEqual(400, cherrypy.response.status)
+        calls.room_ids = [1]
+        response = json.loads(calls.get_rooms(fields=['name']))
+        self.assertEqual([{'name': ''}], response['config'])
+        self.assertEqual(200, cherrypy.response.status)
+
+    def test_accepts_msgpack(self):
+        for accept, expected in [(None, False),
+                                 ('application/json', False),
+                                 ('application/msgpack', True),
+                                 ('application/json, application/x-msgpack;q=0.5', True),
+                                 ('application/msgpack;q=0', False),
+                                 ('application/msgpack; q=0.0, application/json', False),
+                                 ('application/msgpack-like', False)]:
+            self.assertEqual(expected, _accepts_msgpack(accept), accept)
+
+    def test_vary(self):
+        calls = Calls()
+        calls.get_things()
+        self.assertEqual('Accept', cherrypy.response.headers.get('Vary'))
+        cherrypy.serving.response = cherrypy._cprequest.Response()
+        calls.get_things()  # A cache hit
+        self.assertEqual(1, calls.loads)
+        self.assertEqual('Accept', cherrypy.response.headers.get('Vary'))
+
+    def test_invalidation(self):
+        calls = Calls()
+        calls.get_things()
+        calls.do_thing(1)  # Doesn't touch any cached data
+        calls.get_things()
+        self.assertEqual(1, calls.loads)
+        calls.set_things({})
+        calls.get_things()
+        self.assertEqual(2, calls.loads)
+
+    def test_stale_fallback_not_cached(self):
+        calls = Calls()
+        calls.load_status = lambda: [1]
+        self.assertEqual([1], json.loads(calls.get_status())['status'])
+        self.cache.clear()
+
+        def _timeout():
+            raise CommunicationTimedOutException()
+
+        calls.load_status = _timeout
+        for _ in range(2):
+            cherrypy.serving.response = cherrypy._cprequest.Response()
+            self.assertEqual([1], json.loads(calls.get_status())['status'])
+            self.assertEqual('stale', cherrypy.response.headers.get('X-Cache'))
+        self.assertEqual(3, calls.loads)  # The stale response was served, but not cached
+        self.assertEqual({'status': 2}, self.cache.stats['stale_served'])
+
+    def test_single_flight(self):
+        key = ('get_things', False, None)
+        loads = []
+        responses = []
+
+        def _call():
+            now = time.time()
+            response, token = self.cache.get(key, now)
+            if response is None:
+                loads.append(now)
+                time.sleep(0.2)  # A slow load, during which the other calls arrive
+                response = ('application/json', 'data')
+                self.cache.store(key, token, self.cache.generation, now + 5, response)
+            responses.append(response)
+
+        threads = [threading.Thread(target=_call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, len(loads))
+        self.assertEqual([('application/json', 'data')] * 5, responses)
+
+    def test_failed_load_elects_next_loader(self):
+        key = ('get_things', False, None)
+        _, token = self.cache.get(key, time.time())  # This call is now loading
+        loads = []
+        responses = []
+
+        def _call():
+            now = time.time()
+            response, next_token = self.cache.get(key, now)
+            if response is None:
+                loads.append(now)
+                time.sleep(0.2)
+                response = ('application/json', 'data')
+                self.cache.store(key, next_token, self.cache.generation, now + 5, response)
+            responses.append(response)
+
+        threads = [threading.Thread(target=_call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        self.cache.store(key, token, self.cache.generation, time.time() + 5, None)  # The load failed
+        for thread in threads:
+            thread.join(2)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(1, len(loads))  # Only one of the waiting calls loads it again
+        self.assertEqual([('application/json', 'data')] * 5, responses)
+
+    def test_store_keeps_newer_loader(self):
+        key = ('get_things', False, None)
+        _, stuck_token = self.cache.get(key, 100.0)
+        _, token = self.cache.get(key, 100.0 + ResponseCache.LOAD_TIMEOUT)  # Takes over the stuck load
+        self.assertIsNotNone(token)
+        self.cache.store(key, stuck_token, self.cache.generation, 200.0, None)
+        self.assertTrue(stuck_token.is_set())
+        self.assertFalse(token.is_set())  # Calls waiting for the new loader keep waiting
+        self.assertIs(token, self.cache._loading[key][1])
+
+    def test_failed_serialization_releases_waiters(self):
+        calls = Calls()
+        with self.assertRaises(Exception):
+            calls.get_unserializable()
+        start = time.time()
+        with self.assertRaises(Exception):
+            calls.get_unserializable()
+        self.assertLess(time.time() - start, 1)  # Didn't wait for the first, failed, load
+        self.assertEqual(2, calls.loads)
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=xmlrunner.XMLTestRunner(output='../gw-unit-reports'))
@@ -20,7 +20,10 @@ import xmlrunner
 
 import master.core.core_communicator
 from ioc import SetTestMode, SetUpTestInjections
+from master.core.core_command import CoreCommandSpec
 from master.core.core_communicator import Consumer, CoreCommunicator
+from master.core.fields import ByteField
+from serial_utils import CommunicationTimedOutException
 
 
 class CoreCommunicatorTest(unittest.TestCase):
@@ -34,6 +37,53 @@ class CoreCommunicatorTest(unittest.TestCase):
             self.assertRaises(AttributeError, communicator.do_command, None, {})
             discard.assert_called_with(3)
 
+    def test_do_commands(self):
+        communicator, sent = CoreCommunicatorTest._get_answering_communicator(answers=3)
+        command = CoreCommandSpec(instruction='TE',
+                                  request_fields=[ByteField('value')],
+                                  response_fields=[ByteField('value')])
+        results = communicator.do_commands([(command, {'value': value}) for value in [10, 20, 30]])
+        self.assertEqual([10, 20, 30], [value for _, value in sent])
+        self.assertEqual([{'value': 10}, {'value': 20}, {'value': 30}], results)
+        self.assertEqual(1, len(communicator._communication_stats['calls_succeeded']))
+
+    def test_do_commands_timeout(self):
+        communicator, sent = CoreCommunicatorTest._get_answering_communicator(answers=2)
+        command = CoreCommandSpec(instruction='TE',
+                                  request_fields=[ByteField('value')],
+                                  response_fields=[ByteField('value')])
+        with self.assertRaises(CommunicationTimedOutException):
+            communicator.do_commands([(command, {'value': value}) for value in [10, 20, 30]], timeout=0.1)
+        self.assertEqual(3, len(sent))
+        self.assertEqual(1, len(communicator._communication_stats['calls_timedout']))
+        self.assertEqual(0, len(communicator._communication_stats['calls_succeeded']))
+
+    def test_do_command(self):
+        communicator, _ = CoreCommunicatorTest._get_answering_communicator(answers=1)
+        command = CoreCommandSpec(instruction='TE',
+                                  request_fields=[ByteField('value')],
+                                  response_fields=[ByteField('value')])
+        self.assertEqual({'value': 10}, communicator.do_command(command, {'value': 10}))
+
+    @staticmethod
+    def _get_answering_communicator(answers):
+        """ Returns a communicator on which the Core answers the first `answers` commands, in reverse order """
+        communicator = CoreCommunicator(controller_serial=mock.Mock())
+        sent = []
+
+        def send_command(cid, command, fields):
+            _ = command
+            sent.append((cid, fields['value']))
+            if len(sent) == answers:
+                consumers = dict((consumer.cid, consumer)
+                                 for header_consumers in communicator._consumers.values()
+                                 for consumer in header_consumers)
+                for answer_cid, value in reversed(sent):
+                    consumers[answer_cid].consume(chr(value))
+
+        communicator._send_command = send_command
+        return communicator, sent
+
 
 if __name__ == "__main__":
     unittest.main(testRunner=xmlrunner.XMLTestRunner(output='../gw-unit-reports'))
@@ -42,6 +42,38 @@ class MemoryFileTest(unittest.TestCase):
 
     def test_data_consistency(self):
         memory = {}
+        memory_file = MemoryFileTest._get_memory_file(memory)
+
+        memory[5] = [255] * 256
+        memory[5][10] = 1
+        memory[5][11] = 2
+        memory[5][12] = 3
+        address = MemoryAddress(memory_type=MemoryTypes.EEPROM, page=5, offset=10, length=3)
+
+        data = memory_file.read([address])[address]
+        self.assertEqual([1, 2, 3], data)
+        memory_file.write({address: [6, 7, 8]})
+        self.assertEqual([6, 7, 8], memory[5][10:13])
+
+    def test_preload_pages(self):
+        memory = {5: [5] * 256, 7: [7] * 256}
+        reads = []
+        memory_file = MemoryFileTest._get_memory_file(memory, reads)
+        memory_file.preload_pages([7, 5, 7])
+        self.assertEqual({5, 7}, set(memory_file._cache.keys()))
+        self.assertEqual([5] * 8 + [7] * 8, reads)  # A page is read in 8 chunks of 32 bytes
+        self.assertEqual([7] * 256, memory_file._cache[7])
+        del reads[:]
+        memory_file.preload_pages([5])
+        self.assertEqual([5] * 256, memory_file.read_page(5))
+        self.assertEqual([], reads)
+
+    @staticmethod
+    def _get_memory_file(memory, reads=None):
+        """ Returns an EEPROM MemoryFile on top of the given memory, optionally recording the pages of all reads """
+        def _do_commands(commands, timeout=None):
+            _ = timeout
+            return [_do_command(command, fields) for command, fields in commands]
 
         def _do_command(command, fields, timeout=None):
             _ = timeout
@@ -49,6 +81,8 @@ class MemoryFileTest(unittest.TestCase):
                 page = fields['page']
                 start = fields['start']
                 length = fields['length']
+                if reads is not None:
+                    reads.append(page)
                 return {'data': memory.get(page, [255] * 256)[start:start + length]}
             if command.instruction == 'MW':
                 page = fields['page']
@@ -59,20 +93,9 @@ class MemoryFileTest(unittest.TestCase):
 
         master_communicator = Mock()
         master_communicator.do_command = _do_command
+        master_communicator.do_commands = _do_commands
         SetUpTestInjections(master_communicator=master_communicator)
-
-        memory_file = MemoryFile(MemoryTypes.EEPROM)
-
-        memory[5] = [255] * 256
-        memory[5][10] = 1
-        memory[5][11] = 2
-        memory[5][12] = 3
-        address = MemoryAddress(memory_type=MemoryTypes.EEPROM, page=5, offset=10, length=3)
-
-        data = memory_file.read([address])[address]
-        self.assertEqual([1, 2, 3], data)
-        memory_file.write({address: [6, 7, 8]})
-        self.assertEqual([6, 7, 8], memory[5][10:13])
+        return MemoryFile(MemoryTypes.EEPROM)
 
 
 if __name__ == "__main__":
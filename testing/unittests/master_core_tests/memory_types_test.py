@@ -230,6 +230,21 @@ class MemoryTypesTest(unittest.TestCase):
         child.save()
         self.assertEqual([20, 0b0110], memory_map[4])
 
+    def test_preload(self):
+        memory_file_mock = Mock(MemoryFile)
+        SetUpTestInjections(memory_files={MemoryTypes.EEPROM: memory_file_mock})
+
+        class PreloadedObject(MemoryModelDefinition):
+            class _PreloadedObjectComposed(CompositeMemoryModelDefinition):
+                info = CompositeNumberField(start_bit=0, width=8)
+
+            info = MemoryByteField(MemoryTypes.EEPROM, address_spec=lambda id: (id, 0))
+            composed = _PreloadedObjectComposed(field=MemoryByteField(MemoryTypes.EEPROM, address_spec=lambda id: (10 + id, 0)))
+
+        PreloadedObject.preload([1, 3])
+        self.assertEqual(1, memory_file_mock.preload_pages.call_count)
+        self.assertEqual({1, 3, 11, 13}, set(memory_file_mock.preload_pages.call_args[0][0]))
+
     def test_factor_composition(self):
         memory_map = {0: [0]}
 